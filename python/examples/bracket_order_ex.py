@@ -60,7 +60,7 @@ def place_simple_bracket():
     # Check position
     position = client.get_position(instrument)
     print(f"\nPosition Status:")
-    print(f"  Side: {position.market_position.value}")
+    print(f"  Side: {position.market_position.name}")
     print(f"  Quantity: {position.quantity}")
     print(f"  Unrealized P&L: ${position.unrealized_pnl:+,.2f}")
 
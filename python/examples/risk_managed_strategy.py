@@ -264,9 +264,9 @@ class RiskManagedStrategy:
 
     def on_order_update(self, update):
         """Handle order updates"""
-        print(f"[Order Update] {update.order_id}: {update.state.value}")
+        print(f"[Order Update] {update.order_id}: {update.state.name}")
 
-        if update.state.value == "FILLED":
+        if update.state.name == "FILLED":
             print(f"  Filled @ {update.avg_price:.2f}, Qty: {update.filled}")
 
     def on_position_update(self, position):
@@ -346,7 +346,7 @@ class RiskManagedStrategy:
         print(f"  Total P&L: ${account.total_pnl:+,.2f}")
 
         print("\nPosition:")
-        print(f"  Side: {position.market_position.value}")
+        print(f"  Side: {position.market_position.name}")
         print(f"  Quantity: {position.quantity}")
         print(f"  Unrealized P&L: ${position.unrealized_pnl:+,.2f}")
 
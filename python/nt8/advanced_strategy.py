@@ -604,7 +604,7 @@ class AdvancedStrategy:
         print(f"Status @ {datetime.now().strftime('%H:%M:%S')}")
         print(f"{'=' * 70}")
         print(f"Ticks processed: {self.ticks_processed}")
-        print(f"Position: {position.market_position.value} ({position.quantity})")
+        print(f"Position: {position.market_position.name} ({position.quantity})")
         print(f"Daily P&L: ${self.daily_pnl:.2f}")
         print(f"Active orders: {len(self.client.get_active_orders())}")
         
@@ -9,7 +9,7 @@ import uuid
 
 from .types import OrderAction, OrderType, OrderState, TimeInForce, MarketPosition
 from .orders import Order, OrderUpdate, OrderTracker, Position
-from .market_data import TickData, MarketDataManager
+from .market_data import TickData, MarketDataBuffer, MarketDataManager
 from .protocol import BinaryProtocol
 from .account import AccountManager, AccountUpdate, AccountInfo, AccountConnectionStatus
 
@@ -29,6 +29,10 @@ class NT8Client:
         self.protocol = BinaryProtocol()
         self.account_manager = AccountManager(account_name=account_name)
 
+        # Buffer handle for the most recent tick instrument (symbols arrive interned)
+        self._tick_instrument: Optional[str] = None
+        self._tick_buffer: Optional[MarketDataBuffer] = None
+
         # Background threads
         self._read_thread: Optional[threading.Thread] = None
         self._running = False
@@ -135,13 +139,17 @@ class NT8Client:
                 bid=tick_data['bid'],
                 ask=tick_data['ask']
             )
-            self.market_data.add_tick(tick.instrument, tick)
+            buf = self._tick_buffer
+            if buf is None or tick.instrument is not self._tick_instrument:
+                buf = self._tick_buffer = self.market_data.open_stream(tick.instrument)
+                self._tick_instrument = tick.instrument
+            buf.add_tick(tick)
 
         elif msg_type == BinaryProtocol.MSG_ORDER_UPDATE:
             update_data = self.protocol.decode_order_update(data)
             update = OrderUpdate(
                 order_id=update_data['order_id'],
-                state=OrderState(update_data['state']),
+                state=OrderState.parse(update_data['state']),
                 filled=update_data['filled'],
                 remaining=update_data['remaining'],
                 avg_price=update_data['avg_price'],
@@ -156,7 +164,7 @@ class NT8Client:
             pos_data = self.protocol.decode_position_update(data)
             position = Position(
                 instrument=pos_data['instrument'],
-                market_position=pos_data['position'],
+                market_position=MarketPosition.parse(pos_data['position']),
                 quantity=pos_data['quantity'],
                 avg_price=pos_data['avg_price'],
                 unrealized_pnl=pos_data['unrealized_pnl']
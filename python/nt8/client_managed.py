@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import os
 import logging
+import time
+import weakref
+from array import array
 from datetime import datetime
 from functools import lru_cache
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +21,42 @@ DEFAULT_DLL_PATH = Path(
     or r"C:\\Program Files\\NinjaTrader 8\\bin\\NinjaTrader.Client.dll"
 )
 
+# Order type aliases accepted by place_order, normalized to ATI order types.
+_TYPE_MAPPING: Mapping[str, str] = MappingProxyType(
+    {
+        "STOP": "STOP",
+        "STOPMKT": "STOP",
+        "STOP_MARKET": "STOP",
+        "LMT": "LIMIT",
+        "LIMIT": "LIMIT",
+        "MARKET": "MARKET",
+        "MKT": "MARKET",
+    }
+)
+
+# MarketData() field indices captured into the fixed L1 quote: last, bid, ask, trade size.
+_L1_FIELD_COUNT = 4
+
+# Seconds get_orders() reuses an order's status/filled/avg-price snapshot.
+_ORDER_SNAPSHOT_TTL = 0.1
+
+# (attribute, DLL method) pairs bound once per connect() by _bind_client_methods.
+_BOUND_METHODS = (
+    ("_m_command", "Command"),
+    ("_m_orders", "Orders"),
+    ("_m_order_status", "OrderStatus"),
+    ("_m_filled", "Filled"),
+    ("_m_avg_fill_price", "AvgFillPrice"),
+    ("_m_strategies", "Strategies"),
+    ("_m_strategy_position", "StrategyPosition"),
+    ("_m_stop_orders", "StopOrders"),
+    ("_m_target_orders", "TargetOrders"),
+)
+
+# Seconds of per-second volume history kept per instrument.
+VOLUME_HISTORY_SECONDS = 3600
+_ZERO_VOLUME_ROW = array("f", bytes(4 * VOLUME_HISTORY_SECONDS))
+
 
 def _resolve_dll_path(path: os.PathLike[str] | str | None) -> Path:
     candidate = Path(path or DEFAULT_DLL_PATH).expanduser()
@@ -46,9 +85,63 @@ def _load_client_type(dll_path: str):
     return Client
 
 
+def _has_single_string_overload(client: Any, method_name: str) -> bool:
+    """Check via CLR reflection whether ``method_name(string)`` exists on the client."""
+    try:
+        methods = client.GetType().GetMethods()
+    except Exception as exc:  # pragma: no cover - reflection unavailable
+        logger.debug("Reflection on NT8 client failed: %s", exc)
+        return False
+
+    for method in methods:
+        if method.Name != method_name:
+            continue
+        parameters = method.GetParameters()
+        if len(parameters) == 1 and parameters[0].ParameterType.FullName == "System.String":
+            return True
+    return False
+
+
+def _call_float_method(name: str, method: Any, args: Tuple[Any, ...]) -> float | None:
+    """Call a DLL accessor and coerce its result to float.
+
+    Returns None when the call itself fails (so callers can try another method
+    name) and 0.0 when it succeeds with a non-numeric value.
+    """
+    try:
+        value = method(*args)
+    except TypeError as exc:
+        logger.debug("NT8 method %s rejected args %s: %s", name, args, exc)
+        return None
+    except Exception as exc:  # pragma: no cover - defensive guard
+        logger.warning("NT8 method %s failed: %s", name, exc)
+        return None
+
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        logger.debug("NT8 method %s returned non-numeric value %r", name, value)
+        return 0.0
+
+
+def _teardown(client: Any) -> None:
+    """Best-effort DLL disconnect run when a managed client is garbage collected."""
+    try:
+        client.TearDown()
+    except Exception:  # pragma: no cover - best effort cleanup
+        pass
+
+
 class NT8ManagedClient:
     """Thin Python wrapper over NinjaTrader.Client.Client via pythonnet."""
 
+    # Default DLL Command() arguments after the command name: account, instrument,
+    # action, quantity, order_type, limit_price, stop_price, time_in_force, oco_id,
+    # order_id, strategy, strategy_id.
+    _EMPTY_CMD_TAIL: Tuple[Any, ...] = ("", "", "", 0, "", 0.0, 0.0, "", "", "", "", "")
+    _CANCEL_ALL_ARGS: Tuple[Any, ...] = ("CANCELALLORDERS",) + _EMPTY_CMD_TAIL
+    _FLATTEN_ARGS: Tuple[Any, ...] = ("FLATTENEVERYTHING",) + _EMPTY_CMD_TAIL
+
     def __init__(
         self,
         *,
@@ -62,17 +155,43 @@ class NT8ManagedClient:
         self.dll_path = _resolve_dll_path(dll_path)
         client_type = _load_client_type(str(self.dll_path))
         self._client = client_type()
+        # Holds only the DLL handle, so no reference cycle back through self.
+        self._finalizer = weakref.finalize(self, _teardown, self._client)
         self._subscriptions: set[str] = set()
+        self._sub_fast: Dict[str, str] = {}  # trimmed instrument -> subscription key
         self.account = account or os.getenv("NT8_ACCOUNT") or "Sim101"
         self._connected = False
         self._show_popup = 1 if show_connection_popup else 0
 
-        # Volume tracking: accumulate trade sizes per time bar (1 second) per instrument
-        self._bar_volume: Dict[str, float] = {}  # Volume for current bar
-        self._bar_start_time: Dict[str, float] = {}  # Start time of current bar (unix timestamp)
-        self._last_trade_price: Dict[str, float] = {}  # Track price to detect new trades
+        # DLL entry points resolved once per connect()
+        self._m_marketdata: Any = None
+        self._has_raw_md = False
+        self._m_command: Any = None
+        self._m_orders: Any = None
+        self._m_order_status: Any = None
+        self._m_filled: Any = None
+        self._m_avg_fill_price: Any = None
+        self._m_strategies: Any = None
+        self._m_strategy_position: Any = None
+        self._m_stop_orders: Any = None
+        self._m_target_orders: Any = None
+
+        # Volume tracking: accumulate trade sizes per time bar (1 second) per instrument.
+        # State is kept column-wise, one slot per instrument row in _sym_index.
+        self._sym_index: Dict[str, int] = {}  # instrument key -> row index
+        self._vol = array("f")  # Volume for current bar
+        self._bar_start = array("d")  # Start time of current bar (unix timestamp)
+        self._last_px = array("d")  # Track price to detect new trades
         self._bar_duration: float = 1.0  # Bar duration in seconds
 
+        # Per-second volume history: one float32 row of VOLUME_HISTORY_SECONDS slots per
+        # instrument, stored back to back in a single flat ring indexed by epoch second.
+        self._volume_ring = array("f")
+        self._ring_second: List[int] = []  # Last epoch second written, per row
+
+        # order_id -> (monotonic time, status, filled, avg_fill_price) from the last get_orders()
+        self._order_snapshots: Dict[str, Tuple[float, str, int, float]] = {}
+
         setup_result = self._client.SetUp(host, port)
         if setup_result != 0:
             logger.warning("NT8 DLL SetUp(%s, %s) returned %s", host, port, setup_result)
@@ -90,14 +209,28 @@ class NT8ManagedClient:
         self._connected = result == 0
         if not self._connected:
             logger.warning("NT8 DLL connection failed with code %s", result)
+        self._bind_client_methods()
         return self._connected
 
+    def _bind_client_methods(self) -> None:
+        """Resolve DLL methods and overloads once instead of probing them per call."""
+        method = getattr(self._client, "MarketData", None)
+        self._m_marketdata = method if callable(method) else None
+        self._has_raw_md = self._m_marketdata is not None and _has_single_string_overload(
+            self._client, "MarketData"
+        )
+        for attr, name in _BOUND_METHODS:
+            method = getattr(self._client, name, None)
+            setattr(self, attr, method if callable(method) else None)
+
     def authenticate(self) -> bool:
         """Alias kept for parity with existing adapters."""
         return self.connect()
 
     def tear_down(self) -> None:
         """Disconnect from NinjaTrader. Returns 0 on success, -1 on error."""
+        # Explicit teardown replaces the GC-time one, so TearDown() runs only once
+        self._finalizer.detach()
         try:
             result = self._client.TearDown()
             if result == 0:
@@ -112,6 +245,7 @@ class NT8ManagedClient:
 
         self._connected = False
         self._subscriptions.clear()
+        self._sub_fast.clear()
 
     # ------------------------------------------------------------------
     # Helpers
@@ -133,20 +267,9 @@ class NT8ManagedClient:
             method = getattr(self._client, name, None)
             if not callable(method):
                 continue
-            try:
-                value = method(*args)
-            except TypeError as exc:
-                logger.debug("NT8 method %s rejected args %s: %s", name, args, exc)
-                continue
-            except Exception as exc:  # pragma: no cover - defensive guard
-                logger.warning("NT8 method %s failed: %s", name, exc)
-                continue
-
-            try:
-                return float(value)  # type: ignore[arg-type]
-            except (TypeError, ValueError):
-                logger.debug("NT8 method %s returned non-numeric value %r", name, value)
-                return 0.0
+            value = _call_float_method(name, method, args)
+            if value is not None:
+                return value
 
         return 0.0
 
@@ -159,14 +282,17 @@ class NT8ManagedClient:
         if not instrument:
             raise ValueError("Instrument name is required")
 
-        key = instrument.upper()
-        if key in self._subscriptions:
+        # Fast path: already-subscribed spellings skip the upper() allocation.
+        if self._sub_fast.get(instrument) is not None:
             return
 
-        rc = self._client.SubscribeMarketData(instrument)
-        if rc != 0:
-            raise RuntimeError(f"SubscribeMarketData failed for {instrument} (code {rc})")
-        self._subscriptions.add(key)
+        key = instrument.upper()
+        if key not in self._subscriptions:
+            rc = self._client.SubscribeMarketData(instrument)
+            if rc != 0:
+                raise RuntimeError(f"SubscribeMarketData failed for {instrument} (code {rc})")
+            self._subscriptions.add(key)
+        self._sub_fast[instrument] = key
 
     def unsubscribe_market_data(self, instrument: str) -> None:
         instrument = (instrument or "").strip()
@@ -176,7 +302,10 @@ class NT8ManagedClient:
         rc = self._client.UnsubscribeMarketData(instrument)
         if rc != 0:
             logger.warning("UnsubscribeMarketData(%s) returned %s", instrument, rc)
-        self._subscriptions.discard(instrument.upper())
+        key = instrument.upper()
+        self._subscriptions.discard(key)
+        for alias in [alias for alias, value in self._sub_fast.items() if value == key]:
+            del self._sub_fast[alias]
 
     def _market_data(self, instrument: str, data_type: int) -> float:
         self._ensure_connection()
@@ -184,9 +313,11 @@ class NT8ManagedClient:
         return float(value) if value is not None else 0.0
 
     def _capture_market_data_fields(self, instrument: str, max_fields: int = 8) -> Dict[str, Any]:
-        snapshot: Dict[str, Any] = {"fields": {}, "raw_payload": None}
-        method = getattr(self._client, "MarketData", None)
-        if callable(method):
+        fields: Dict[int, Any] = {}
+        l1 = [0.0] * _L1_FIELD_COUNT  # numeric last/bid/ask/trade size, 0.0 when missing
+        snapshot: Dict[str, Any] = {"fields": fields, "l1": l1, "raw_payload": None}
+        method = self._m_marketdata
+        if method is not None:
             for index in range(max_fields):
                 try:
                     value = method(instrument, index)
@@ -198,9 +329,13 @@ class NT8ManagedClient:
                 if value is None:
                     continue
                 try:
-                    snapshot["fields"][index] = float(value)  # type: ignore[arg-type]
+                    number = float(value)  # type: ignore[arg-type]
                 except (TypeError, ValueError):
-                    snapshot["fields"][index] = value
+                    fields[index] = value
+                    continue
+                fields[index] = number
+                if index < _L1_FIELD_COUNT:
+                    l1[index] = number
         else:
             logger.debug("Managed NT8 client exposes no MarketData() method")
 
@@ -210,13 +345,10 @@ class NT8ManagedClient:
         return snapshot
 
     def _try_market_data_raw(self, instrument: str) -> Any:
-        method = getattr(self._client, "MarketData", None)
-        if not callable(method):
+        if not self._has_raw_md:
             return None
         try:
-            return method(instrument)
-        except TypeError:
-            return None
+            return self._m_marketdata(instrument)
         except Exception as exc:
             logger.debug("Raw MarketData(%s) call failed: %s", instrument, exc)
             return None
@@ -310,39 +442,37 @@ class NT8ManagedClient:
 
         snapshot = self._capture_market_data_fields(instrument)
         fields: Dict[int, Any] = snapshot.get("fields", {})
-        logger.debug("Managed market data fields for %s: %s", instrument, fields)
-        if snapshot.get("raw_payload") is not None:
-            logger.debug("Managed raw MarketData payload for %s: %s", instrument, snapshot["raw_payload"])
+        # Per-quote diagnostics: check the level first so disabled DEBUG costs one call.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Managed market data fields for %s: %s", instrument, fields)
+            if snapshot.get("raw_payload") is not None:
+                logger.debug("Managed raw MarketData payload for %s: %s", instrument, snapshot["raw_payload"])
 
-        last = float(fields.get(0, 0.0) or 0.0)
-        bid = float(fields.get(1, 0.0) or 0.0)
-        ask = float(fields.get(2, 0.0) or 0.0)
-        trade_size = float(fields.get(3, 0.0) or 0.0)
+        last, bid, ask, trade_size = snapshot["l1"]
         timestamp = datetime.now()
         current_time = timestamp.timestamp()
 
         # Track volume per time bar (1 second bars)
-        instrument_key = instrument.upper()
-        if instrument_key not in self._bar_volume:
-            self._bar_volume[instrument_key] = 0.0
-            self._bar_start_time[instrument_key] = current_time
-            self._last_trade_price[instrument_key] = 0.0
+        row = self._instrument_row(instrument.upper(), current_time)
+        bar_volume = self._vol
 
         # Check if we've moved to a new bar
-        bar_start = self._bar_start_time[instrument_key]
-        if current_time - bar_start >= self._bar_duration:
+        if current_time - self._bar_start[row] >= self._bar_duration:
             # New bar - reset volume and update start time
-            self._bar_volume[instrument_key] = 0.0
-            self._bar_start_time[instrument_key] = current_time
+            bar_volume[row] = 0.0
+            self._bar_start[row] = current_time
 
         # Only add volume if there was a trade (trade_size > 0 and price changed)
+        traded = 0.0
         if trade_size > 0:
             # Check if this is a new trade (price changed or first trade)
-            if last != self._last_trade_price[instrument_key]:
-                self._bar_volume[instrument_key] += trade_size
-                self._last_trade_price[instrument_key] = last
+            if last != self._last_px[row]:
+                bar_volume[row] += trade_size
+                self._last_px[row] = last
+                traded = trade_size
+        self._record_volume_history(row, current_time, traded)
 
-        volume = self._bar_volume[instrument_key]
+        volume = bar_volume[row]
 
         data: Dict[str, Any] = {
             "instrument": instrument,
@@ -378,8 +508,67 @@ class NT8ManagedClient:
 
     def get_volume(self, instrument: str) -> float:
         """Get current bar volume for an instrument."""
-        instrument_key = instrument.upper()
-        return self._bar_volume.get(instrument_key, 0.0)
+        row = self._sym_index.get(instrument.upper())
+        return self._vol[row] if row is not None else 0.0
+
+    def _instrument_row(self, instrument_key: str, current_time: float) -> int:
+        """Return the state row for an instrument, allocating a zeroed row on first use."""
+        row = self._sym_index.get(instrument_key)
+        if row is None:
+            row = len(self._ring_second)
+            self._sym_index[instrument_key] = row
+            self._vol.append(0.0)
+            self._bar_start.append(current_time)
+            self._last_px.append(0.0)
+            self._volume_ring.extend(_ZERO_VOLUME_ROW)
+            self._ring_second.append(int(current_time))
+        return row
+
+    def _record_volume_history(self, row: int, current_time: float, size: float) -> None:
+        slots = VOLUME_HISTORY_SECONDS
+        second = int(current_time)
+        base = row * slots
+        ring = self._volume_ring
+
+        last_second = self._ring_second[row]
+        if second != last_second:
+            # Zero every slot the clock skipped so stale volume never leaks into a window.
+            gap = second - last_second
+            if gap < 0 or gap >= slots:
+                ring[base:base + slots] = _ZERO_VOLUME_ROW
+            else:
+                for skipped in range(last_second + 1, second + 1):
+                    ring[base + skipped % slots] = 0.0
+            self._ring_second[row] = second
+
+        if size:
+            ring[base + second % slots] += size
+
+    def get_rolling_volume(self, instrument: str, seconds: int = 60) -> float:
+        """Get traded volume over the trailing window from the per-second history.
+
+        Args:
+            instrument: Instrument to query
+            seconds: Window length in seconds (capped at VOLUME_HISTORY_SECONDS)
+        """
+        row = self._sym_index.get(instrument.upper())
+        if row is None or seconds <= 0:
+            return 0.0
+
+        slots = VOLUME_HISTORY_SECONDS
+        now_second = int(datetime.now().timestamp())
+        last_second = self._ring_second[row]
+        first = max(now_second - min(seconds, slots) + 1, last_second - slots + 1)
+        if first > last_second:
+            return 0.0
+
+        base = row * slots
+        start = base + first % slots
+        stop = base + last_second % slots + 1
+        ring = self._volume_ring
+        if start < stop:
+            return float(sum(ring[start:stop]))
+        return float(sum(ring[start:base + slots]) + sum(ring[base:stop]))
 
     def reset_volume(self, instrument: str | None = None) -> None:
         """Reset bar volume counter(s).
@@ -388,14 +577,20 @@ class NT8ManagedClient:
             instrument: Specific instrument to reset, or None to reset all
         """
         if instrument:
-            instrument_key = instrument.upper()
-            self._bar_volume[instrument_key] = 0.0
-            self._bar_start_time[instrument_key] = datetime.now().timestamp()
-            self._last_trade_price[instrument_key] = 0.0
+            now = datetime.now().timestamp()
+            row = self._instrument_row(instrument.upper(), now)
+            self._vol[row] = 0.0
+            self._bar_start[row] = now
+            self._last_px[row] = 0.0
+            base = row * VOLUME_HISTORY_SECONDS
+            self._volume_ring[base:base + VOLUME_HISTORY_SECONDS] = _ZERO_VOLUME_ROW
         else:
-            self._bar_volume.clear()
-            self._bar_start_time.clear()
-            self._last_trade_price.clear()
+            self._sym_index.clear()
+            self._vol = array("f")
+            self._bar_start = array("d")
+            self._last_px = array("d")
+            self._volume_ring = array("f")
+            self._ring_second.clear()
 
     def set_bar_duration(self, seconds: float) -> None:
         """Set the bar duration for volume tracking.
@@ -492,44 +687,23 @@ class NT8ManagedClient:
     # ------------------------------------------------------------------
     # Order Management (DLL Command interface)
     # ------------------------------------------------------------------
-    def _command(
-        self,
-        command: str,
-        account: str = "",
-        instrument: str = "",
-        action: str = "",
-        quantity: int = 0,
-        order_type: str = "",
-        limit_price: float = 0,
-        stop_price: float = 0,
-        time_in_force: str = "",
-        oco_id: str = "",
-        order_id: str = "",
-        strategy: str = "",
-        strategy_id: str = "",
-    ) -> int:
-        """Execute an ATI command via the DLL Command function."""
+    def _run_command(self, args: Tuple[Any, ...]) -> int:
+        """Invoke the DLL Command function with the full 13-argument positional tuple."""
         self._ensure_connection()
-        method = getattr(self._client, "Command", None)
-        if not callable(method):
+        method = self._m_command
+        if method is None:
             raise RuntimeError("NT8 DLL does not expose the Command function")
 
+        # Commands change order state, so drop the get_orders snapshots they may
+        # have made stale: just the targeted order, or all of them for bulk commands.
+        order_id = args[10] if len(args) > 10 else ""
+        if order_id:
+            self._order_snapshots.pop(order_id, None)
+        else:
+            self._order_snapshots.clear()
+
         try:
-            result = method(
-                command,
-                account,
-                instrument,
-                action,
-                quantity,
-                order_type,
-                limit_price,
-                stop_price,
-                time_in_force,
-                oco_id,
-                order_id,
-                strategy,
-                strategy_id,
-            )
+            result = method(*args)
             if result is not None:
                 try:
                     return int(result)  # type: ignore[arg-type]
@@ -537,7 +711,7 @@ class NT8ManagedClient:
                     return 0
             return 0
         except Exception as exc:
-            logger.error("NT8 Command(%s) failed: %s", command, exc)
+            logger.error("NT8 Command(%s) failed: %s", args[0], exc)
             raise
 
     def new_order_id(self) -> str:
@@ -595,31 +769,24 @@ class NT8ManagedClient:
             order_type_str = order_type.upper()
         else:
             order_type_str = str(order_type).upper()
-        type_mapping = {
-            "STOP": "STOP",
-            "STOPMKT": "STOP",
-            "STOP_MARKET": "STOP",
-            "LMT": "LIMIT",
-            "LIMIT": "LIMIT",
-            "MARKET": "MARKET",
-            "MKT": "MARKET",
-        }
-        order_type_str = type_mapping.get(order_type_str, order_type_str)
+        order_type_str = _TYPE_MAPPING.get(order_type_str, order_type_str)
 
-        result = self._command(
-            "PLACE",
-            account_name,
-            instrument,
-            action_str,
-            int(quantity),
-            order_type_str,
-            float(limit_price) if limit_price else 0,
-            float(stop_price) if stop_price else 0,
-            time_in_force.upper(),
-            oco_id,
-            order_id,
-            strategy,
-            generated_strategy_id,
+        result = self._run_command(
+            (
+                "PLACE",
+                account_name,
+                instrument,
+                action_str,
+                int(quantity),
+                order_type_str,
+                float(limit_price) if limit_price else 0.0,
+                float(stop_price) if stop_price else 0.0,
+                time_in_force.upper(),
+                oco_id,
+                order_id,
+                strategy,
+                generated_strategy_id,
+            )
         )
 
         if result != 0:
@@ -640,20 +807,22 @@ class NT8ManagedClient:
         strategy_id: str = "",
     ) -> bool:
         """Modify an existing order via the DLL Command interface."""
-        result = self._command(
-            "CHANGE",
-            "",  # account
-            "",  # instrument
-            "",  # action
-            int(quantity) if quantity is not None else 0,
-            "",  # order_type
-            float(limit_price) if limit_price is not None else 0,
-            float(stop_price) if stop_price is not None else 0,
-            "",  # time_in_force
-            "",  # oco_id
-            order_id,
-            "",  # strategy
-            strategy_id,
+        result = self._run_command(
+            (
+                "CHANGE",
+                "",  # account
+                "",  # instrument
+                "",  # action
+                int(quantity) if quantity is not None else 0,
+                "",  # order_type
+                float(limit_price) if limit_price is not None else 0.0,
+                float(stop_price) if stop_price is not None else 0.0,
+                "",  # time_in_force
+                "",  # oco_id
+                order_id,
+                "",  # strategy
+                strategy_id,
+            )
         )
         if result != 0:
             logger.warning("modify_order(%s) returned code %s", order_id, result)
@@ -662,20 +831,22 @@ class NT8ManagedClient:
 
     def cancel_order(self, order_id: str, strategy_id: str = "") -> bool:
         """Cancel an order via the DLL Command interface."""
-        result = self._command(
-            "CANCEL",
-            "",  # account
-            "",  # instrument
-            "",  # action
-            0,   # quantity
-            "",  # order_type
-            0,   # limit_price
-            0,   # stop_price
-            "",  # time_in_force
-            "",  # oco_id
-            order_id,
-            "",  # strategy
-            strategy_id,
+        result = self._run_command(
+            (
+                "CANCEL",
+                "",   # account
+                "",   # instrument
+                "",   # action
+                0,    # quantity
+                "",   # order_type
+                0.0,  # limit_price
+                0.0,  # stop_price
+                "",   # time_in_force
+                "",   # oco_id
+                order_id,
+                "",   # strategy
+                strategy_id,
+            )
         )
         if result != 0:
             logger.warning("cancel_order(%s) returned code %s", order_id, result)
@@ -684,7 +855,7 @@ class NT8ManagedClient:
 
     def cancel_all_orders(self, account: str | None = None) -> bool:
         """Cancel all active orders via the DLL Command interface."""
-        result = self._command("CANCELALLORDERS")
+        result = self._run_command(self._CANCEL_ALL_ARGS)
         if result != 0:
             logger.warning("cancel_all_orders returned code %s", result)
             return False
@@ -693,11 +864,7 @@ class NT8ManagedClient:
     def close_position(self, account: str | None = None, instrument: str = "") -> bool:
         """Close a position via the DLL Command interface."""
         account_name = self._resolve_account(account)
-        result = self._command(
-            "CLOSEPOSITION",
-            account_name,
-            instrument,
-        )
+        result = self._run_command(("CLOSEPOSITION", account_name, instrument) + self._EMPTY_CMD_TAIL[2:])
         if result != 0:
             logger.warning("close_position(%s, %s) returned code %s", account_name, instrument, result)
             return False
@@ -705,21 +872,7 @@ class NT8ManagedClient:
 
     def close_strategy(self, strategy_id: str) -> bool:
         """Close an ATM Strategy via the DLL Command interface."""
-        result = self._command(
-            "CLOSESTRATEGY",
-            "",  # account
-            "",  # instrument
-            "",  # action
-            0,   # quantity
-            "",  # order_type
-            0,   # limit_price
-            0,   # stop_price
-            "",  # time_in_force
-            "",  # oco_id
-            "",  # order_id
-            "",  # strategy
-            strategy_id,
-        )
+        result = self._run_command(("CLOSESTRATEGY",) + self._EMPTY_CMD_TAIL[:11] + (strategy_id,))
         if result != 0:
             logger.warning("close_strategy(%s) returned code %s", strategy_id, result)
             return False
@@ -727,7 +880,7 @@ class NT8ManagedClient:
 
     def flatten_everything(self) -> bool:
         """Flatten all positions and cancel all orders via the DLL Command interface."""
-        result = self._command("FLATTENEVERYTHING")
+        result = self._run_command(self._FLATTEN_ARGS)
         if result != 0:
             logger.warning("flatten_everything returned code %s", result)
             return False
@@ -754,20 +907,22 @@ class NT8ManagedClient:
             order_id = self.new_order_id()
 
         action_str = "SELL" if str(action).upper().startswith("S") else "BUY"
-        result = self._command(
-            "REVERSEPOSITION",
-            account_name,
-            instrument,
-            action_str,
-            int(quantity),
-            order_type.upper(),
-            float(limit_price) if limit_price else 0,
-            float(stop_price) if stop_price else 0,
-            time_in_force.upper(),
-            oco_id,
-            order_id,
-            strategy,
-            strategy_id,
+        result = self._run_command(
+            (
+                "REVERSEPOSITION",
+                account_name,
+                instrument,
+                action_str,
+                int(quantity),
+                order_type.upper(),
+                float(limit_price) if limit_price else 0.0,
+                float(stop_price) if stop_price else 0.0,
+                time_in_force.upper(),
+                oco_id,
+                order_id,
+                strategy,
+                strategy_id,
+            )
         )
 
         if result != 0:
@@ -818,8 +973,8 @@ class NT8ManagedClient:
         account_name = self._resolve_account(account)
         orders: List[Dict[str, Any]] = []
 
-        orders_method = getattr(self._client, "Orders", None)
-        if not callable(orders_method):
+        orders_method = self._m_orders
+        if orders_method is None:
             logger.debug("NT8 DLL does not expose Orders() function")
             return orders
 
@@ -830,10 +985,23 @@ class NT8ManagedClient:
 
             order_ids = [oid.strip() for oid in str(orders_str).split("|") if oid.strip()]
 
+            # The DLL has no multi-order accessors, so reuse recent per-order snapshots
+            # to avoid three DLL round-trips per order on rapid refresh loops.
+            now = time.monotonic()
+            previous = self._order_snapshots
+            snapshots: Dict[str, Tuple[float, str, int, float]] = {}
+
             for order_id in order_ids:
-                status = self.get_order_status(order_id)
-                filled = self.get_filled(order_id)
-                avg_fill_price = self.get_avg_fill_price(order_id)
+                snapshot = previous.get(order_id)
+                if snapshot is None or now - snapshot[0] >= _ORDER_SNAPSHOT_TTL:
+                    snapshot = (
+                        now,
+                        self.get_order_status(order_id),
+                        self.get_filled(order_id),
+                        self.get_avg_fill_price(order_id),
+                    )
+                snapshots[order_id] = snapshot
+                _, status, filled, avg_fill_price = snapshot
 
                 orders.append({
                     "id": order_id,
@@ -850,6 +1018,8 @@ class NT8ManagedClient:
                     "limit_price": 0.0,  # Not available from DLL
                 })
 
+            self._order_snapshots = snapshots
+
         except Exception as exc:
             logger.warning("get_orders failed: %s", exc)
 
@@ -858,8 +1028,8 @@ class NT8ManagedClient:
     def get_order_status(self, order_id: str) -> str:
         """Get order status via DLL OrderStatus function."""
         self._ensure_connection()
-        method = getattr(self._client, "OrderStatus", None)
-        if not callable(method):
+        method = self._m_order_status
+        if method is None:
             return "Unknown"
 
         try:
@@ -872,8 +1042,8 @@ class NT8ManagedClient:
     def get_filled(self, order_id: str) -> int:
         """Get filled quantity via DLL Filled function."""
         self._ensure_connection()
-        method = getattr(self._client, "Filled", None)
-        if not callable(method):
+        method = self._m_filled
+        if method is None:
             return 0
 
         try:
@@ -890,14 +1060,20 @@ class NT8ManagedClient:
 
     def get_avg_fill_price(self, order_id: str) -> float:
         """Get average fill price via DLL AvgFillPrice function."""
-        return self._call_float(("AvgFillPrice",), order_id)
+        self._ensure_connection()
+        method = self._m_avg_fill_price
+        if method is None:
+            return 0.0
+
+        value = _call_float_method("AvgFillPrice", method, (order_id,))
+        return 0.0 if value is None else value
 
     def get_strategies(self, account: str | None = None) -> List[str]:
         """Get ATM strategy IDs via DLL Strategies function."""
         self._ensure_connection()
         account_name = self._resolve_account(account)
-        method = getattr(self._client, "Strategies", None)
-        if not callable(method):
+        method = self._m_strategies
+        if method is None:
             return []
 
         try:
@@ -912,8 +1088,8 @@ class NT8ManagedClient:
     def get_strategy_position(self, strategy_id: str) -> int:
         """Get strategy position via DLL StrategyPosition function."""
         self._ensure_connection()
-        method = getattr(self._client, "StrategyPosition", None)
-        if not callable(method):
+        method = self._m_strategy_position
+        if method is None:
             return 0
 
         try:
@@ -931,8 +1107,8 @@ class NT8ManagedClient:
     def get_stop_orders(self, strategy_id: str) -> List[str]:
         """Get Stop Loss order IDs for an ATM strategy via DLL StopOrders function."""
         self._ensure_connection()
-        method = getattr(self._client, "StopOrders", None)
-        if not callable(method):
+        method = self._m_stop_orders
+        if method is None:
             return []
 
         try:
@@ -947,8 +1123,8 @@ class NT8ManagedClient:
     def get_target_orders(self, strategy_id: str) -> List[str]:
         """Get Profit Target order IDs for an ATM strategy via DLL TargetOrders function."""
         self._ensure_connection()
-        method = getattr(self._client, "TargetOrders", None)
-        if not callable(method):
+        method = self._m_target_orders
+        if method is None:
             return []
 
         try:
@@ -982,9 +1158,3 @@ class NT8ManagedClient:
     def _ensure_connection(self) -> None:
         if not self._connected and not self.connect():
             raise RuntimeError("Unable to connect to NinjaTrader via DLL")
-
-    def __del__(self) -> None:  # pragma: no cover - best effort cleanup
-        try:
-            self.tear_down()
-        except Exception:
-            pass
@@ -2,13 +2,38 @@ import pandas as pd
 import os
 import time
 import logging
+import select
 import socket
 import threading
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Callable, Dict, Optional, Sequence
 
 logger = logging.getLogger(__name__)
 
+_RECV_SIZE = 65536
+_MAX_PENDING_BYTES = 1 << 20  # Drop a partial record that never terminates
+_POLL_INTERVAL = 0.5  # Seconds between stop-event checks while the stream is idle
+_FILE_TAIL_BYTES = 4096  # Enough to hold the last CSV record
+
+
+def _build_line_parser(columns: Sequence[str]) -> Callable[[str], Dict[str, float]]:
+    """Generate a straight-line parser for a fixed CSV schema whose first column is skipped.
+
+    The returned function raises IndexError/ValueError on short or malformed lines.
+    """
+    fields = ",\n        ".join(
+        f"{name!r}: float(p[{i}])" for i, name in enumerate(columns) if i > 0
+    )
+    source = (
+        "def parse(line):\n"
+        "    p = line.split(',')\n"
+        f"    return {{\n        {fields},\n    }}\n"
+    )
+    namespace: Dict[str, Callable[[str], Dict[str, float]]] = {}
+    exec(source, namespace)
+    return namespace["parse"]
+
+
 class NT8IndicatorClient:
     """
     Client for receiving indicator data from NT8 NTPythonIndicatorExporter strategy.
@@ -36,11 +61,12 @@ class NT8IndicatorClient:
         
         # State
         self.latest_data: Optional[Dict[str, float]] = None
-        self.last_update_time = 0
+        self.last_update_time = 0.0
         self.tcp_connected = False
         
         # File monitoring state
-        self._last_file_mtime = 0
+        self._last_file_mtime = 0.0
+        self._last_file_size = -1
         
         # Column mapping
         self.columns = [
@@ -53,6 +79,7 @@ class NT8IndicatorClient:
             "RSI_5m", "MACD_5m", "MACD_Signal_5m", "MACD_Hist_5m", "Trend_5m",
             "RSI_15m", "MACD_15m", "MACD_Signal_15m", "MACD_Hist_15m", "Trend_15m"
         ]
+        self._parse = _build_line_parser(self.columns)  # Skips Time
         
         # Start TCP Loop
         self._stop_event = threading.Event()
@@ -73,26 +100,59 @@ class NT8IndicatorClient:
                         self.tcp_connected = True
                         logger.info(f"✅ Connected to NT8 Indicator TCP Server on port {self.tcp_port}")
                         
-                        # Set longer timeout for reading
-                        s.settimeout(None) 
-                        file_obj = s.makefile('r', encoding='utf-8')
-                        
-                        for line in file_obj:
-                            if self._stop_event.is_set(): break
-                            if not line.strip(): continue
-                            
-                            self._parse_indicator_line(line.strip())
-                                
+                        # Reads are gated by select() so an idle stream can't block shutdown
+                        s.settimeout(None)
+                        buffer = bytearray()
+
+                        while not self._stop_event.is_set():
+                            readable, _, _ = select.select([s], [], [], _POLL_INTERVAL)
+                            if not readable:
+                                continue
+                            chunk = s.recv(_RECV_SIZE)
+                            if not chunk:
+                                break  # Server closed the stream
+                            buffer += chunk
+
+                            end = buffer.rfind(b'\n')
+                            if end < 0:
+                                if len(buffer) > _MAX_PENDING_BYTES:
+                                    buffer.clear()
+                                continue
+
+                            # Only the newest complete record is kept, so parse just that one
+                            # line of the burst and drop everything up to the last newline.
+                            stop = end
+                            while stop > 0 and buffer[stop - 1] in b'\r\n':
+                                stop -= 1
+                            start = buffer.rfind(b'\n', 0, stop) + 1
+                            line = buffer[start:stop].decode('utf-8', errors='replace').strip()
+                            del buffer[:end + 1]
+
+                            if line:
+                                self._parse_indicator_line(line)
+
                     except (socket.error, ConnectionRefusedError) as e:
                         pass  # Silent retry
             except Exception as e:
                 logger.error(f"TCP Loop Error: {e}")
                 
             self.tcp_connected = False
-            time.sleep(2)  # Retry delay
+            self._stop_event.wait(2)  # Retry delay, cut short by close()
     
     def _parse_indicator_line(self, line: str) -> Optional[Dict[str, float]]:
         """Parse a CSV line into indicator dictionary."""
+        try:
+            data = self._parse(line)
+        except (IndexError, ValueError):
+            # Short or malformed line - fall back to the per-field parse
+            return self._parse_indicator_fields(line)
+
+        self.latest_data = data
+        self.last_update_time = time.time()
+        return data
+
+    def _parse_indicator_fields(self, line: str) -> Optional[Dict[str, float]]:
+        """Parse a CSV line field by field, skipping values that are not numeric."""
         parts = line.split(',')
         if len(parts) < len(self.columns):
             return None
@@ -143,27 +203,41 @@ class NT8IndicatorClient:
                 return self.latest_data  # Return last known data
             
             # Check if file was modified
-            mtime = target_file.stat().st_mtime
-            if mtime <= self._last_file_mtime:
+            stat = target_file.stat()
+            mtime, size = stat.st_mtime, stat.st_size
+            if mtime <= self._last_file_mtime and size == self._last_file_size:
                 return self.latest_data  # No change, return cached
             
             self._last_file_mtime = mtime
+            self._last_file_size = size
 
-            # Read file - expects header + single data line (or just CSV data)
-            content = target_file.read_text()
-            lines = content.strip().split('\n')
-            
-            if len(lines) < 1:
+            # Read only the file tail - expects header + data lines (or just CSV data)
+            data_line = self._read_last_line(target_file, size)
+            if not data_line:
                 return self.latest_data
             
             # Parse the data line (last non-empty line with data)
-            data_line = lines[-1]
             return self._parse_indicator_line(data_line)
 
         except Exception as e:
             logger.error(f"Error reading indicator file: {e}")
             return self.latest_data
             
+    @staticmethod
+    def _read_last_line(path: Path, size: int) -> str:
+        """Return the last non-empty line of a file, reading only its tail."""
+        with open(path, 'rb') as f:
+            offset = max(0, size - _FILE_TAIL_BYTES)
+            f.seek(offset)
+            tail = f.read().rstrip()
+            start = tail.rfind(b'\n') + 1
+            if start == 0 and offset > 0:
+                # Record longer than the tail window - fall back to the whole file
+                f.seek(0)
+                tail = f.read().rstrip()
+                start = tail.rfind(b'\n') + 1
+        return tail[start:].decode('utf-8', errors='replace').strip()
+
     def close(self):
         self._stop_event.set()
         if self._tcp_thread.is_alive():
@@ -1,10 +1,14 @@
+import logging
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Callable, Dict
-from collections import deque
+from typing import List, Callable, Dict, Optional
+from .types import _DATACLASS_SLOTS
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class TickData:
     """Single tick of market data"""
     instrument: str
@@ -25,7 +29,7 @@ class TickData:
         return (self.bid + self.ask) / 2.0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MarketDepthLevel:
     """Single level in market depth"""
     price: float
@@ -33,33 +37,124 @@ class MarketDepthLevel:
     position: int  # 0 = best bid/ask
 
 
+def _notify_subscribers(subscribers: List[Callable], tick: "TickData"):
+    """Call every subscriber, logging and skipping any callback that raises.
+
+    The try block wraps the whole loop and is only re-entered after a failure,
+    so the steady state pays for one exception handler per tick, not one per callback.
+    """
+    index = 0
+    count = len(subscribers)
+    while index < count:
+        try:
+            while index < count:
+                subscribers[index](tick)
+                index += 1
+        except Exception:
+            logger.exception("Error in tick callback")
+            index += 1
+
+
 class MarketDataBuffer:
-    """Efficient circular buffer for market data"""
+    """Efficient circular buffer for market data
+
+    Ticks are stored column-wise in fixed-size typed arrays (price, bid, ask,
+    volume) plus parallel timestamp/instrument slots, so per-tick storage holds
+    no TickData objects. TickData is only built for subscribers and readers.
+    """
     
     def __init__(self, maxlen: int = 10000):
-        self.ticks: deque = deque(maxlen=maxlen)
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self.maxlen = maxlen
+        self._px = array('d', bytes(8 * maxlen))
+        self._bid = array('d', bytes(8 * maxlen))
+        self._ask = array('d', bytes(8 * maxlen))
+        self._vol = array('q', bytes(8 * maxlen))
+        self._ts: List[Optional[datetime]] = [None] * maxlen
+        self._inst: List[str] = [""] * maxlen
+        self._idx = 0  # Next slot to write
+        self._n = 0  # Number of valid slots
         self.subscribers: List[Callable] = []
-    
+
+    def __len__(self) -> int:
+        return self._n
+
+    @property
+    def ticks(self) -> List[TickData]:
+        """All buffered ticks, oldest first, as a new list.
+
+        Each access builds a fresh TickData per buffered tick (up to maxlen), so
+        avoid it in per-tick code; get_latest(n) or get_latest_prices() are cheaper.
+        The list is a copy: appending to or editing it does not change the buffer.
+        """
+        return self.get_latest(0)
+
+    def add_quote(self, instrument: str, timestamp: datetime, price: float,
+                  volume: int, bid: float, ask: float, *, tick: Optional[TickData] = None):
+        """Store a tick from its fields; a TickData is only built for subscribers.
+
+        Volume is stored as an int (fractional volumes are truncated). Pass an
+        already-built ``tick`` to hand that object to subscribers instead.
+        """
+        i = self._idx
+        self._px[i] = price
+        self._bid[i] = bid
+        self._ask[i] = ask
+        self._vol[i] = int(volume)
+        self._ts[i] = timestamp
+        self._inst[i] = instrument
+        i += 1
+        self._idx = 0 if i == self.maxlen else i
+        if self._n < self.maxlen:
+            self._n += 1
+
+        subscribers = self.subscribers
+        if subscribers:
+            if tick is None:
+                tick = TickData(instrument, timestamp, price, volume, bid, ask)
+            _notify_subscribers(subscribers, tick)
+
     def add_tick(self, tick: TickData):
         """Add tick and notify subscribers"""
-        self.ticks.append(tick)
-        for callback in self.subscribers:
-            try:
-                callback(tick)
-            except Exception as e:
-                print(f"Error in tick callback: {e}")
+        self.add_quote(tick.instrument, tick.timestamp, tick.price, tick.volume,
+                       tick.bid, tick.ask, tick=tick)
     
     def subscribe(self, callback: Callable):
         """Subscribe to tick updates"""
         self.subscribers.append(callback)
+
+    def _tail_start(self, count: int) -> tuple:
+        """Return (first slot, tick count) for the newest `count` ticks (all if count <= 0)"""
+        n = self._n if count <= 0 else min(count, self._n)
+        return (self._idx - n) % self.maxlen, n
     
     def get_latest(self, count: int = 1) -> List[TickData]:
         """Get last N ticks"""
-        return list(self.ticks)[-count:] if count > 0 else list(self.ticks)
+        start, n = self._tail_start(count)
+        maxlen = self.maxlen
+        ticks = []
+        for k in range(n):
+            i = (start + k) % maxlen
+            ticks.append(TickData(self._inst[i], self._ts[i], self._px[i],
+                                  self._vol[i], self._bid[i], self._ask[i]))
+        return ticks
+
+    def get_latest_prices(self, count: int = 0) -> array:
+        """Get last N prices, oldest first, as a contiguous float64 array
+
+        The result supports the buffer protocol (e.g. numpy.frombuffer) for
+        vectorized analytics. count <= 0 returns every buffered price.
+        """
+        start, n = self._tail_start(count)
+        stop = start + n
+        if stop <= self.maxlen:
+            return self._px[start:stop]
+        return self._px[start:] + self._px[:stop - self.maxlen]
     
     def get_latest_price(self) -> float:
         """Get most recent price"""
-        return self.ticks[-1].price if self.ticks else 0.0
+        return self._px[self._idx - 1] if self._n else 0.0
 
 
 class MarketDataManager:
@@ -68,15 +163,24 @@ class MarketDataManager:
     def __init__(self):
         self.buffers: Dict[str, MarketDataBuffer] = {}
     
+    def open_stream(self, instrument: str) -> MarketDataBuffer:
+        """Get or create the buffer for instrument as a handle producers can cache.
+
+        Feeding ticks straight into the returned buffer skips the per-tick lookup
+        done by add_tick().
+        """
+        buffer = self.buffers.get(instrument)
+        if buffer is None:
+            buffer = self.buffers[instrument] = MarketDataBuffer()
+        return buffer
+    
     def get_buffer(self, instrument: str) -> MarketDataBuffer:
         """Get or create buffer for instrument"""
-        if instrument not in self.buffers:
-            self.buffers[instrument] = MarketDataBuffer()
-        return self.buffers[instrument]
+        return self.open_stream(instrument)
     
     def add_tick(self, instrument: str, tick: TickData):
         """Add tick to appropriate buffer"""
-        self.get_buffer(instrument).add_tick(tick)
+        self.open_stream(instrument).add_tick(tick)
     
     def subscribe(self, instrument: str, callback: Callable):
         """Subscribe to tick updates for instrument"""
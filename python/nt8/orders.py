@@ -1,10 +1,11 @@
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, Dict
-from .types import OrderAction, OrderType, OrderState, MarketPosition
+from .types import OrderAction, OrderType, OrderState, MarketPosition, _DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Order:
     """Represents a trading order"""
     order_id: str
@@ -30,15 +31,15 @@ class Order:
     @property
     def is_filled(self) -> bool:
         """Check if order is completely filled"""
-        return self.state == OrderState.FILLED
+        return self.state is OrderState.FILLED
     
     @property
     def is_partially_filled(self) -> bool:
         """Check if order is partially filled"""
-        return self.state == OrderState.PART_FILLED
+        return self.state is OrderState.PART_FILLED
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class OrderUpdate:
     """Order state update event"""
     order_id: str
@@ -50,7 +51,7 @@ class OrderUpdate:
     error_message: str = ""
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Position:
     """Current position for an instrument"""
     instrument: str
@@ -80,10 +81,34 @@ class OrderTracker:
         self.orders: Dict[str, Order] = {}
         self.positions: Dict[str, Position] = {}
         self.filled_orders: Dict[str, Order] = {}
+        # Active-order indexes, kept in step with add_order/update_order
+        self._active: Dict[str, Order] = {}
+        self._by_instrument: Dict[str, Dict[str, Order]] = defaultdict(dict)
+    
+    def _index_order(self, order: Order):
+        """Add or remove an order from the active indexes based on its state"""
+        if order.is_active:
+            self._active[order.order_id] = order
+            self._by_instrument[order.instrument][order.order_id] = order
+        else:
+            self._unindex_order(order)
+    
+    def _unindex_order(self, order: Order):
+        """Remove an order from the active indexes"""
+        self._active.pop(order.order_id, None)
+        by_instrument = self._by_instrument.get(order.instrument)
+        if by_instrument is not None:
+            by_instrument.pop(order.order_id, None)
+            if not by_instrument:
+                del self._by_instrument[order.instrument]
     
     def add_order(self, order: Order):
         """Add new order to tracking"""
+        previous = self.orders.get(order.order_id)
+        if previous is not None and previous is not order:
+            self._unindex_order(previous)
         self.orders[order.order_id] = order
+        self._index_order(order)
     
     def update_order(self, update: OrderUpdate):
         """Update order state"""
@@ -98,8 +123,12 @@ class OrderTracker:
                 order.filled_time = update.timestamp
                 self.filled_orders[order.order_id] = order
                 del self.orders[order.order_id]
+                self._unindex_order(order)
             elif update.state in (OrderState.CANCELLED, OrderState.REJECTED):
                 del self.orders[update.order_id]
+                self._unindex_order(order)
+            else:
+                self._index_order(order)
     
     def update_position(self, position: Position):
         """Update position information"""
@@ -111,7 +140,7 @@ class OrderTracker:
     
     def get_active_orders(self, instrument: Optional[str] = None) -> list:
         """Get active orders, optionally filtered by instrument"""
-        orders = [o for o in self.orders.values() if o.is_active]
         if instrument:
-            orders = [o for o in orders if o.instrument == instrument]
-        return orders
\ No newline at end of file
+            orders = self._by_instrument.get(instrument)
+            return list(orders.values()) if orders else []
+        return list(self._active.values())
\ No newline at end of file
@@ -1,5 +1,69 @@
+import functools
 import struct
+import sys
 from datetime import datetime
+from typing import Dict
+
+# Precompiled wire layouts (format parsed once at import, not per message). '<' is
+# little-endian with no alignment padding, matching the packed C# BinaryWriter output.
+_ORDER_CMD = struct.Struct('<B32sIB8sdd32s')
+_TICK = struct.Struct('<Bddqdd32s')
+_ORDER_UPDATE = struct.Struct('<B32sBIIdd')
+_POS = struct.Struct('<B32sBidd')
+_ACCT = struct.Struct('<B32sdddddd16s')
+_INSTR = struct.Struct('<B32sddd16s')
+_MODIFY = struct.Struct('<32sIdd')
+
+_ORDER_TYPE_CODES = {"MARKET": 1, "LIMIT": 2, "STOP_MARKET": 3, "STOP_LIMIT": 4}
+
+# Wire code -> name, indexed by the state/position byte
+_ORDER_STATES = ("UNKNOWN", "SUBMITTED", "ACCEPTED", "WORKING",
+                 "FILLED", "PART_FILLED", "CANCELLED", "REJECTED")
+_POS_NAMES = ("FLAT", "LONG", "SHORT")
+
+
+def _decode_symbol(field: bytes) -> str:
+    """Decode a NUL-padded symbol/ID field, decoding only the bytes before the first NUL"""
+    nul = field.find(b'\x00')
+    if nul >= 0:
+        field = field[:nul]
+    try:
+        return field.decode('ascii')
+    except UnicodeDecodeError:
+        return field.decode('utf-8', errors='replace')
+
+
+# Raw 32-byte instrument field -> interned symbol. Only a handful of symbols stream,
+# so repeat ticks reuse one str object (cheap dict keys downstream).
+_SYM_CACHE: Dict[bytes, str] = {}
+_SYM_CACHE_MAX = 4096
+
+
+def _intern_symbol(field: bytes) -> str:
+    """Decode an instrument field once per distinct value and return the interned name"""
+    name = _SYM_CACHE.get(field)
+    if name is None:
+        if len(_SYM_CACHE) >= _SYM_CACHE_MAX:
+            _SYM_CACHE.clear()
+        name = _SYM_CACHE[field] = sys.intern(_decode_symbol(field))
+    return name
+
+
+def _pad_field(text: str, width: int) -> bytes:
+    """Encode text as a fixed-width NUL-padded field, truncating to width bytes"""
+    return text.encode('utf-8')[:width].ljust(width, b'\x00')
+
+
+# Instruments, TIFs and signal names repeat across a session's orders, so their padded
+# fields are cached. Order IDs are unique per order and are padded directly.
+@functools.lru_cache(maxsize=256)
+def _pad32(text: str) -> bytes:
+    return _pad_field(text, 32)
+
+
+@functools.lru_cache(maxsize=8)
+def _pad8(text: str) -> bytes:
+    return _pad_field(text, 8)
 
 
 class BinaryProtocol:
@@ -26,15 +90,10 @@ class BinaryProtocol:
         Total: 94 bytes
         """
         action_byte = 1 if action == "BUY" else 2
-        type_map = {"MARKET": 1, "LIMIT": 2, "STOP_MARKET": 3, "STOP_LIMIT": 4}
-        type_byte = type_map.get(order_type, 1)
-        tif_bytes = tif.encode('utf-8')[:8].ljust(8, b'\\x00')
-        instrument_bytes = instrument.encode('utf-8')[:32].ljust(32, b'\\x00')
-        signal_bytes = signal_name.encode('utf-8')[:32].ljust(32, b'\\x00')
-        
-        return struct.pack('B32sIB8sdd32s',
-            action_byte, instrument_bytes, quantity, type_byte,
-            tif_bytes, limit_price, stop_price, signal_bytes)
+        type_byte = _ORDER_TYPE_CODES.get(order_type, 1)
+        return _ORDER_CMD.pack(
+            action_byte, _pad32(instrument), quantity, type_byte,
+            _pad8(tif), limit_price, stop_price, _pad32(signal_name))
     
     @staticmethod
     def decode_tick_data(data: bytes) -> dict:
@@ -44,14 +103,14 @@ class BinaryProtocol:
                 bid(8) + ask(8) + instrument(32)
         Total: 73 bytes
         """
-        unpacked = struct.unpack('Bddqdd32s', data)
+        unpacked = _TICK.unpack_from(data)
         return {
             'timestamp': unpacked[1],
             'price': unpacked[2],
             'volume': unpacked[3],
             'bid': unpacked[4],
             'ask': unpacked[5],
-            'instrument': unpacked[6].decode('utf-8').rstrip('\\x00')
+            'instrument': _intern_symbol(unpacked[6])
         }
     
     @staticmethod
@@ -62,13 +121,12 @@ class BinaryProtocol:
                 remaining(4) + avg_price(8) + timestamp(8)
         Total: 58 bytes
         """
-        unpacked = struct.unpack('B32sBIIdd', data)
-        state_map = {1: "SUBMITTED", 2: "ACCEPTED", 3: "WORKING", 
-                     4: "FILLED", 5: "PART_FILLED", 6: "CANCELLED", 7: "REJECTED"}
-        
+        unpacked = _ORDER_UPDATE.unpack_from(data)
+        state = unpacked[2]
+
         return {
-            'order_id': unpacked[1].decode('utf-8').rstrip('\\x00'),
-            'state': state_map.get(unpacked[2], "UNKNOWN"),
+            'order_id': _decode_symbol(unpacked[1]),
+            'state': _ORDER_STATES[state] if state < len(_ORDER_STATES) else "UNKNOWN",
             'filled': unpacked[3],
             'remaining': unpacked[4],
             'avg_price': unpacked[5],
@@ -78,12 +136,12 @@ class BinaryProtocol:
     @staticmethod
     def decode_position_update(data: bytes) -> dict:
         """Decode position update message"""
-        unpacked = struct.unpack('B32sBidd', data)
-        position_map = {0: "FLAT", 1: "LONG", 2: "SHORT"}
+        unpacked = _POS.unpack_from(data)
+        position = unpacked[2]
 
         return {
-            'instrument': unpacked[1].decode('utf-8').rstrip('\\x00'),
-            'position': position_map.get(unpacked[2], "FLAT"),
+            'instrument': _intern_symbol(unpacked[1]),
+            'position': _POS_NAMES[position] if position < len(_POS_NAMES) else "FLAT",
             'quantity': unpacked[3],
             'avg_price': unpacked[4],
             'unrealized_pnl': unpacked[5]
@@ -99,17 +157,17 @@ class BinaryProtocol:
         Total: 97 bytes
         """
         try:
-            unpacked = struct.unpack('B32sddddddd16s', data)
+            unpacked = _ACCT.unpack_from(data)
 
             return {
-                'account_name': unpacked[1].decode('utf-8').rstrip('\\x00'),
+                'account_name': unpacked[1].rstrip(b'\x00').decode('utf-8'),
                 'timestamp': unpacked[2],
                 'cash_value': unpacked[3],
                 'buying_power': unpacked[4],
                 'realized_pnl': unpacked[5],
                 'unrealized_pnl': unpacked[6],
                 'net_liquidation': unpacked[7],
-                'update_type': unpacked[8].decode('utf-8').rstrip('\\x00')
+                'update_type': unpacked[8].rstrip(b'\x00').decode('utf-8')
             }
         except struct.error:
             # Fallback for partial updates
@@ -133,14 +191,14 @@ class BinaryProtocol:
         Total: 73 bytes
         """
         try:
-            unpacked = struct.unpack('B32sddd16s', data)
+            unpacked = _INSTR.unpack_from(data)
 
             return {
-                'instrument': unpacked[1].decode('utf-8').rstrip('\\x00'),
+                'instrument': _intern_symbol(unpacked[1]),
                 'tick_size': unpacked[2],
                 'point_value': unpacked[3],
                 'min_move': unpacked[4],
-                'exchange': unpacked[5].decode('utf-8').rstrip('\\x00')
+                'exchange': unpacked[5].rstrip(b'\x00').decode('utf-8')
             }
         except struct.error:
             return {
@@ -157,8 +215,7 @@ class BinaryProtocol:
         Encode order cancellation command
         Format: order_id(32)
         """
-        order_id_bytes = order_id.encode('utf-8')[:32].ljust(32, b'\\x00')
-        return order_id_bytes
+        return _pad_field(order_id, 32)
 
     @staticmethod
     def encode_modify_command(order_id: str, quantity: int = 0,
@@ -169,5 +226,4 @@ class BinaryProtocol:
         Format: order_id(32) + quantity(4) + limit_price(8) + stop_price(8)
         Total: 52 bytes
         """
-        order_id_bytes = order_id.encode('utf-8')[:32].ljust(32, b'\\x00')
-        return struct.pack('32sIdd', order_id_bytes, quantity, limit_price, stop_price)
\ No newline at end of file
+        return _MODIFY.pack(_pad_field(order_id, 32), quantity, limit_price, stop_price)
\ No newline at end of file
@@ -4,15 +4,94 @@ Advanced Risk Management for NT8 Trading
 Provides position sizing, risk controls, and exposure management
 """
 
-from dataclasses import dataclass, field
+from __future__ import annotations
+
+from dataclasses import dataclass
 from datetime import datetime, time as datetime_time
-from typing import Optional, Dict, List, Callable, TYPE_CHECKING
+from typing import Any, Optional, Dict, List, Callable, Mapping, Tuple, TYPE_CHECKING
 from enum import Enum
+import bisect
 import math
+import sys
+import threading
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional analytics dependency
+    np = None  # type: ignore
+
+try:
+    import numba  # type: ignore
+except ImportError:  # pragma: no cover - optional JIT dependency
+    numba = None  # type: ignore
+
+_prange = numba.prange if numba is not None else range
 
 if TYPE_CHECKING:
     # Avoid circular imports
-    from bot_v3.session_manager import SessionManager
+    from bot_v3.session_manager import SessionManager  # type: ignore
+
+
+def _risk_per_contract_py(entry: float, stop: float, tick_size: float, tick_value: float) -> float:
+    """Dollar risk per contract for a stop placed at ``stop``"""
+    return abs(entry - stop) / tick_size * tick_value
+
+
+def _risk_per_contract_loop(entry: Any, stop: Any, tick_size: Any, tick_value: Any) -> Any:
+    """Element-wise _risk_per_contract over equal-length 1-D float64 arrays (numba kernel)"""
+    n = entry.shape[0]
+    out = np.empty(n)
+    for i in _prange(n):
+        out[i] = abs(entry[i] - stop[i]) / tick_size[i] * tick_value[i]
+    return out
+
+
+def _risk_per_contract_np(entry: Any, stop: Any, tick_size: Any, tick_value: Any) -> Any:
+    """Element-wise _risk_per_contract over equal-length 1-D float64 arrays"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.abs(entry - stop) / tick_size * tick_value
+
+
+_risk_per_contract: Callable[[float, float, float, float], float]
+_risk_per_contract_vec: Callable[[Any, Any, Any, Any], Any]
+
+# numba compiles from bytecode; a mypyc-built module is already native and has none.
+# Explicit signatures compile eagerly at import (or load from cache) instead of on the
+# first sizing call inside the trading loop; ints are converted to float64 on entry.
+if numba is not None and hasattr(_risk_per_contract_py, '__code__'):
+    _risk_per_contract = numba.njit('f8(f8, f8, f8, f8)', cache=True, fastmath=True)(
+        _risk_per_contract_py
+    )
+    _risk_per_contract_vec = numba.njit(
+        'f8[:](f8[:], f8[:], f8[:], f8[:])', cache=True, parallel=True, error_model='numpy'
+    )(_risk_per_contract_loop)
+else:
+    _risk_per_contract = _risk_per_contract_py
+    _risk_per_contract_vec = _risk_per_contract_np
+
+
+def _make_kelly(tick_size: float, tick_value: float, fraction: float) -> Callable[[float, float, float, float], int]:
+    """
+    Build a fractional-Kelly sizer with one instrument's constants baked in
+
+    The returned ``f(p_win, win, loss, balance)`` takes win/loss as price
+    distances to target and stop and returns contracts (never negative).
+    """
+    # Kelly edge p - q/b with b = win/loss, scaled into contracts by the stop's dollar risk
+    scale = fraction * tick_size / tick_value
+    source = (
+        "def kelly(p_win, win, loss, balance):\n"
+        "    edge = p_win - (1.0 - p_win) * loss / win\n"
+        "    if edge <= 0.0:\n"
+        "        return 0\n"
+        f"    return int(balance * edge * {scale!r} / loss)\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    kelly: Callable[[float, float, float, float], int] = namespace["kelly"]
+    return kelly
 
 
 class RiskLevel(str, Enum):
@@ -23,6 +102,34 @@ class RiskLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# Daily-loss-used percentages at which each risk level starts, for get_risk_level
+_RISK_THRESHOLDS = (50.0, 70.0, 90.0)
+_RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+# RiskLimits fields that feed its precomputed constants
+_RISK_LIMITS_DERIVED_FROM = frozenset({
+    'risk_per_trade_pct', 'max_daily_loss', 'max_total_loss',
+    'daily_profit_target', 'max_daily_profit', 'trading_start_time', 'trading_end_time'
+})
+
+
+def _to_cents(dollars: float) -> int:
+    """Dollar amount as whole cents, rounded half to even"""
+    return int(round(dollars * 100))
+
+
+def _optional_cents(dollars: Optional[float]) -> Optional[int]:
+    return None if dollars is None else _to_cents(dollars)
+
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+def _minute_of_day(value: Optional[datetime_time]) -> Optional[int]:
+    """Minutes since midnight for a time of day, or None"""
+    return None if value is None else value.hour * 60 + value.minute
+
+
 @dataclass
 class RiskLimits:
     """Risk management limits configuration"""
@@ -53,7 +160,10 @@ class RiskLimits:
     max_consecutive_losses: int = 3
     cool_down_after_losses: int = 300  # seconds
 
-    def __post_init__(self):
+    # Derived constants are plain attributes assigned in _update_derived(), not
+    # fields, so fields()/asdict()/astuple() see only the configuration.
+
+    def __post_init__(self) -> None:
         """Validate limits"""
         if self.max_risk_per_trade <= 0:
             raise ValueError("max_risk_per_trade must be positive")
@@ -61,6 +171,39 @@ class RiskLimits:
             raise ValueError("max_daily_loss must be positive")
         if not (0 < self.risk_per_trade_pct <= 100):
             raise ValueError("risk_per_trade_pct must be between 0 and 100")
+        self._update_derived()
+        self._ready: bool = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Keep derived constants in step once __post_init__ has run
+        if name in _RISK_LIMITS_DERIVED_FROM and getattr(self, '_ready', False):
+            self._update_derived()
+
+    def _update_derived(self) -> None:
+        """Precompute constants used by per-trade and per-tick risk checks"""
+        self._risk_per_trade_frac: float = self.risk_per_trade_pct / 100.0
+        self._inv_max_daily_loss: float = 1.0 / self.max_daily_loss
+        # P&L limits in whole cents, matching RiskManager's integer P&L accounting
+        self._max_daily_loss_cents: int = _to_cents(self.max_daily_loss)
+        self._max_total_loss_cents: int = _to_cents(self.max_total_loss)
+        self._daily_profit_target_cents: Optional[int] = _optional_cents(self.daily_profit_target)
+        self._max_daily_profit_cents: Optional[int] = _optional_cents(self.max_daily_profit)
+        # Trading window as one byte per minute of the day, 1 = trading allowed.
+        # Both ends are inclusive; start >= end is an overnight session.
+        start = _minute_of_day(self.trading_start_time)
+        end = _minute_of_day(self.trading_end_time)
+        if start is None or end is None:
+            mask = bytearray(b'\x01') * _MINUTES_PER_DAY
+        elif start < end:
+            mask = bytearray(_MINUTES_PER_DAY)
+            mask[start:end + 1] = b'\x01' * (end + 1 - start)
+        else:
+            mask = bytearray(b'\x01') * _MINUTES_PER_DAY
+            gap = start - end - 1
+            if gap > 0:
+                mask[end + 1:start] = bytes(gap)
+        self._minute_mask: bytes = bytes(mask)
 
 
 @dataclass
@@ -76,9 +219,7 @@ class TradeRiskMetrics:
     @property
     def risk_per_contract(self) -> float:
         """Calculate risk per contract in dollars"""
-        points_at_risk = abs(self.entry_price - self.stop_loss)
-        ticks_at_risk = points_at_risk / self.tick_size
-        return ticks_at_risk * self.tick_value
+        return _risk_per_contract(self.entry_price, self.stop_loss, self.tick_size, self.tick_value)
 
     @property
     def total_risk(self) -> float:
@@ -95,9 +236,31 @@ class TradeRiskMetrics:
 class PositionSizer:
     """Calculate optimal position sizes based on risk"""
 
-    def __init__(self, account_balance: float, risk_limits: RiskLimits):
+    __slots__ = ('account_balance', 'risk_limits', 'kelly_fraction', '_kelly_fns')
+
+    account_balance: float
+    risk_limits: RiskLimits
+    kelly_fraction: float
+    _kelly_fns: Dict[str, Tuple[float, float, float, Callable[[float, float, float, float], int]]]
+
+    def __init__(self, account_balance: float, risk_limits: RiskLimits,
+                 kelly_fraction: float = 0.5) -> None:
         self.account_balance = account_balance
         self.risk_limits = risk_limits
+        self.kelly_fraction = kelly_fraction  # Share of full Kelly to bet
+        # instrument -> (tick_size, tick_value, kelly_fraction, specialized sizer)
+        self._kelly_fns = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Generated sizers can't be pickled; they are rebuilt on first use
+        return {'account_balance': self.account_balance, 'risk_limits': self.risk_limits,
+                'kelly_fraction': self.kelly_fraction}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.account_balance = state['account_balance']
+        self.risk_limits = state['risk_limits']
+        self.kelly_fraction = state.get('kelly_fraction', 0.5)
+        self._kelly_fns = {}
 
     def calculate_position_size(
         self,
@@ -121,32 +284,132 @@ class PositionSizer:
             Number of contracts to trade
         """
         # Calculate risk per contract
-        points_at_risk = abs(entry_price - stop_loss)
-        if points_at_risk == 0:
+        if entry_price == stop_loss:
             return 0
 
-        ticks_at_risk = points_at_risk / tick_size
-        risk_per_contract = ticks_at_risk * tick_value
+        risk_per_contract = _risk_per_contract(entry_price, stop_loss, tick_size, tick_value)
 
-        # Calculate based on dollar risk limit
-        max_by_dollar_risk = int(self.risk_limits.max_risk_per_trade / risk_per_contract)
+        limits = self.risk_limits
+        cap = limits.max_contracts_per_trade
+        if max_contracts is not None and max_contracts < cap:
+            cap = max_contracts
 
-        # Calculate based on account percentage
-        account_risk_dollars = self.account_balance * (self.risk_limits.risk_per_trade_pct / 100.0)
-        max_by_account_pct = int(account_risk_dollars / risk_per_contract)
-
-        # Apply position size limits
+        # Smallest of the dollar-risk limit, account-percentage limit and contract cap
+        account_risk_dollars = self.account_balance * limits._risk_per_trade_frac
         position_size = min(
-            max_by_dollar_risk,
-            max_by_account_pct,
-            self.risk_limits.max_contracts_per_trade
+            int(limits.max_risk_per_trade / risk_per_contract),
+            int(account_risk_dollars / risk_per_contract),
+            cap
+        )
+        return position_size if position_size > 0 else 0
+
+    def calculate_position_size_batch(
+        self,
+        entry_price,
+        stop_loss,
+        tick_size,
+        tick_value,
+        max_contracts: Optional[int] = None
+    ):
+        """
+        Calculate position sizes for many candidate trades at once
+
+        Same rules as calculate_position_size, evaluated element-wise over
+        array-like inputs (scalars broadcast). Requires numpy.
+
+        Args:
+            entry_price: Entry prices
+            stop_loss: Stop loss prices
+            tick_size: Instrument tick sizes
+            tick_value: Dollar values per tick
+            max_contracts: Optional maximum contracts override
+
+        Returns:
+            numpy int64 array of contract counts
+        """
+        if np is None:
+            raise RuntimeError(
+                "calculate_position_size_batch requires numpy (pip install nt8sdk[analytics])"
+            )
+
+        entry, stop, tick_size, tick_value = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (entry_price, stop_loss, tick_size, tick_value))
         )
+        risk_per_contract = _risk_per_contract_vec(
+            entry.ravel(), stop.ravel(), tick_size.ravel(), tick_value.ravel()
+        ).reshape(entry.shape)
 
-        # Apply max contracts override if provided
+        limits = self.risk_limits
+        account_risk_dollars = self.account_balance * limits._risk_per_trade_frac
+        cap = limits.max_contracts_per_trade
         if max_contracts is not None:
-            position_size = min(position_size, max_contracts)
+            cap = min(cap, max_contracts)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            max_by_dollar_risk = np.trunc(limits.max_risk_per_trade / risk_per_contract)
+            max_by_account_pct = np.trunc(account_risk_dollars / risk_per_contract)
+        position_size = np.minimum.reduce([max_by_dollar_risk, max_by_account_pct,
+                                           np.full_like(risk_per_contract, cap)])
 
-        return max(0, position_size)
+        # Zero-distance stops size to nothing, as in the scalar path
+        position_size = np.where(entry == stop, 0.0, position_size)
+        return np.clip(position_size, 0, max(cap, 0)).astype(np.int64)
+
+    def calculate_kelly_size(
+        self,
+        instrument: str,
+        p_win: float,
+        win: float,
+        loss: float,
+        tick_size: Optional[float] = None,
+        tick_value: Optional[float] = None
+    ) -> int:
+        """
+        Calculate a fractional-Kelly position size
+
+        The sizer is compiled once per instrument with its tick constants
+        baked in; tick_size/tick_value are required on the first call for an
+        instrument and may be omitted afterwards.
+
+        Args:
+            instrument: Trading instrument
+            p_win: Probability of the trade reaching its target (0-1)
+            win: Distance from entry to target, in price points
+            loss: Distance from entry to stop, in price points
+            tick_size: Instrument tick size
+            tick_value: Dollar value per tick
+
+        Returns:
+            Number of contracts to trade, never more than calculate_position_size
+            allows for the same stop (dollar-risk, account-percentage and contract caps)
+        """
+        if not (0.0 <= p_win <= 1.0):
+            raise ValueError("p_win must be between 0 and 1")
+        if win <= 0 or loss <= 0:
+            raise ValueError("win and loss must be positive price distances")
+
+        entry = self._kelly_fns.get(instrument)
+        if tick_size is None or tick_value is None:
+            if entry is None:
+                raise ValueError(f"tick_size and tick_value are required to size {instrument}")
+            tick_size, tick_value = entry[0], entry[1]
+
+        # Recompile only when the instrument's constants (or the Kelly fraction) change
+        fraction = self.kelly_fraction
+        if entry is None or entry[0] != tick_size or entry[1] != tick_value or entry[2] != fraction:
+            entry = (tick_size, tick_value, fraction, _make_kelly(tick_size, tick_value, fraction))
+            self._kelly_fns[instrument] = entry
+
+        balance = self.account_balance
+        limits = self.risk_limits
+        risk_per_contract = loss / tick_size * tick_value
+        position_size = min(
+            entry[3](p_win, win, loss, balance),
+            int(limits.max_risk_per_trade / risk_per_contract),
+            int(balance * limits._risk_per_trade_frac / risk_per_contract),
+            limits.max_contracts_per_trade
+        )
+        return position_size if position_size > 0 else 0
 
     def calculate_stop_loss(
         self,
@@ -177,32 +440,109 @@ class PositionSizer:
         else:
             return entry_price + points_to_risk
 
-    def update_account_balance(self, new_balance: float):
+    def update_account_balance(self, new_balance: float) -> None:
         """Update account balance for position sizing calculations"""
         self.account_balance = new_balance
 
 
+_STATUS_TEMPLATE = """
+Risk Manager Status:
+  Trading Enabled: {trading_enabled}
+  Risk Level: {risk_level}
+  Daily P&L: ${daily_pnl:+,.2f}
+  Total P&L: ${total_pnl:+,.2f}
+  Daily Trades: {daily_trades}
+  Consecutive Losses: {consecutive_losses}
+  Active Instruments: {active_instruments}/{max_instruments}
+  Total Contracts: {total_contracts}/{max_total_contracts}
+  Daily Loss Used: {daily_loss_used_pct:.1f}%
+"""
+
+# Below this many open positions mark_to_market sums in Python rather than via numpy
+_VDOT_MIN_POSITIONS = 16
+
+# Closed-trade P&Ls kept for rolling statistics
+_PNL_WINDOW = 256
+
+# RiskManager instance attributes (its __slots__, also the pickled state)
+_RISK_MANAGER_SLOTS = (
+    'risk_limits', 'position_sizer',
+    '_daily_pnl_cents', '_total_pnl_cents', '_pnl_lock', 'daily_trades', 'total_trades',
+    'consecutive_losses', 'last_loss_time',
+    '_positions_lock', '_instruments', '_quantities', '_value_factors', 'total_contracts',
+    '_pnl_ring', '_pnl_head', '_pnl_count',
+    'on_risk_violation', 'on_limit_reached',
+    'trading_enabled', 'shutdown_reason',
+    '_session_manager',
+    '_block_reason', '_in_trading_hours', '_hours_recheck_at',
+)
+
+# can_trade reasons that also shut trading down
+_LOSS_LIMIT_REASONS = frozenset({"Daily loss limit reached", "Total loss limit reached"})
+
+
 class RiskManager:
     """Comprehensive risk management system"""
 
-    def __init__(self, risk_limits: RiskLimits, initial_balance: float):
+    __slots__ = _RISK_MANAGER_SLOTS
+
+    risk_limits: RiskLimits
+    position_sizer: PositionSizer
+    _daily_pnl_cents: int
+    _total_pnl_cents: int
+    _pnl_lock: threading.Lock
+    daily_trades: int
+    total_trades: int
+    consecutive_losses: int
+    last_loss_time: float
+    _positions_lock: threading.Lock
+    _instruments: List[str]
+    _quantities: array[int]
+    _value_factors: array[float]
+    total_contracts: int
+    _pnl_ring: array[float]
+    _pnl_head: int
+    _pnl_count: int
+    on_risk_violation: Optional[Callable[[str, RiskLevel], None]]
+    on_limit_reached: Optional[Callable[[str], None]]
+    trading_enabled: bool
+    shutdown_reason: Optional[str]
+    _session_manager: Optional[SessionManager]
+    _block_reason: Optional[str]
+    _in_trading_hours: bool
+    _hours_recheck_at: float
+
+    def __init__(self, risk_limits: RiskLimits, initial_balance: float) -> None:
         self.risk_limits = risk_limits
         self.position_sizer = PositionSizer(initial_balance, risk_limits)
 
         # Tracking
-        self.daily_pnl = 0.0
-        self.total_pnl = 0.0
+        # P&L is kept in whole cents so accumulation is exact and limit checks compare ints
+        self._daily_pnl_cents = 0
+        self._total_pnl_cents = 0
+        self._pnl_lock = threading.Lock()  # Guards P&L read-modify-writes across strategy threads
         self.daily_trades = 0
         self.total_trades = 0
 
         # Loss tracking
         self.consecutive_losses = 0
-        self.last_loss_time: Optional[datetime] = None
-
-        # Position tracking
-        self.active_positions: Dict[str, int] = {}  # instrument -> quantity
+        self.last_loss_time: float = 0.0  # time.monotonic() of the last loss, 0.0 if none
+
+        # Position tracking, column-wise: _quantities[i] is the signed open quantity of
+        # _instruments[i] (positive long, negative short).
+        # Lookups and edits take _positions_lock so the columns can't fall out of step.
+        self._positions_lock = threading.Lock()
+        self._instruments: List[str] = []  # interned instrument names
+        self._quantities = array('q')
+        self._value_factors = array('d')  # tick_value / tick_size, dollars per point
         self.total_contracts = 0
 
+        # Recent closed-trade P&Ls, circular: _pnl_head is the next slot to overwrite.
+        # Fixed size so numpy views from rolling_pnl_array stay valid.
+        self._pnl_ring = array('d', bytes(8 * _PNL_WINDOW))
+        self._pnl_head = 0
+        self._pnl_count = 0
+
         # Callbacks
         self.on_risk_violation: Optional[Callable[[str, RiskLevel], None]] = None
         self.on_limit_reached: Optional[Callable[[str], None]] = None
@@ -210,6 +550,47 @@ class RiskManager:
         # State
         self.trading_enabled = True
         self.shutdown_reason: Optional[str] = None
+        self._session_manager: Optional["SessionManager"] = None
+
+        # Cached checks for can_trade_fast
+        self._block_reason: Optional[str] = None
+        self._in_trading_hours = True
+        self._hours_recheck_at = 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = {name: getattr(self, name) for name in _RISK_MANAGER_SLOTS if hasattr(self, name)}
+        del state['_pnl_lock']
+        del state['_positions_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._pnl_lock = threading.Lock()
+        self._positions_lock = threading.Lock()
+
+    @property
+    def daily_pnl(self) -> float:
+        """Realized P&L for the current day"""
+        return self._daily_pnl_cents / 100.0
+
+    @daily_pnl.setter
+    def daily_pnl(self, value: float) -> None:
+        cents = _to_cents(value)
+        with self._pnl_lock:
+            self._daily_pnl_cents = cents
+        self._recompute_block_reason()
+
+    @property
+    def total_pnl(self) -> float:
+        """Realized P&L since the manager was created"""
+        return self._total_pnl_cents / 100.0
+
+    @property
+    def active_positions(self) -> Dict[str, int]:
+        """Snapshot of signed open quantity per instrument (positive long, negative short)"""
+        with self._positions_lock:
+            return dict(zip(self._instruments, self._quantities))
 
     def can_trade(self, instrument: str, quantity: int) -> tuple[bool, str]:
         """
@@ -229,49 +610,119 @@ class RiskManager:
         if not self._is_trading_time():
             return False, "Outside trading hours"
 
-        # Check daily loss limit
-        if self.daily_pnl <= -self.risk_limits.max_daily_loss:
-            self._trigger_shutdown("Daily loss limit reached")
-            return False, "Daily loss limit reached"
+        # Check P&L limits
+        reason = self._pnl_block_reason()
+        if reason is not None:
+            if reason in _LOSS_LIMIT_REASONS:
+                self._trigger_shutdown(reason)
+            return False, reason
 
-        # Check total loss limit
-        if self.total_pnl <= -self.risk_limits.max_total_loss:
-            self._trigger_shutdown("Total loss limit reached")
-            return False, "Total loss limit reached"
+        return self._check_position_limits(instrument, quantity)
 
-        # Check daily profit target
-        if (self.risk_limits.daily_profit_target is not None and
-            self.daily_pnl >= self.risk_limits.daily_profit_target):
-            return False, "Daily profit target reached"
+    def can_trade_fast(self, instrument: str, quantity: int) -> tuple[bool, str]:
+        """
+        Hot-path variant of can_trade for per-signal loops
 
-        # Check max daily profit cap
-        if (self.risk_limits.max_daily_profit is not None and
-            self.daily_pnl >= self.risk_limits.max_daily_profit):
-            return False, "Max daily profit reached"
+        P&L limits are read from a reason cached whenever P&L changes, and the
+        trading-hours check is re-evaluated at most once per minute. Call
+        refresh_limits() after changing risk_limits on a live manager.
+
+        Args:
+            instrument: Trading instrument
+            quantity: Proposed quantity
+
+        Returns:
+            Tuple of (allowed, reason)
+        """
+        if not self.trading_enabled:
+            return False, f"Trading disabled: {self.shutdown_reason}"
+
+        if time.monotonic() >= self._hours_recheck_at:
+            self._refresh_trading_hours()
+        if not self._in_trading_hours:
+            return False, "Outside trading hours"
+
+        reason = self._block_reason
+        if reason is not None:
+            if reason in _LOSS_LIMIT_REASONS:
+                self._trigger_shutdown(reason)
+            return False, reason
+
+        return self._check_position_limits(instrument, quantity)
+
+    def _check_position_limits(self, instrument: str, quantity: int) -> tuple[bool, str]:
+        """Cool-down, contract and instrument checks shared by can_trade and can_trade_fast"""
+        rl = self.risk_limits
 
         # Check consecutive losses cool-down
-        if self.consecutive_losses >= self.risk_limits.max_consecutive_losses:
-            if self.last_loss_time:
-                time_since_loss = (datetime.now() - self.last_loss_time).total_seconds()
-                if time_since_loss < self.risk_limits.cool_down_after_losses:
-                    remaining = int(self.risk_limits.cool_down_after_losses - time_since_loss)
+        if self.consecutive_losses >= rl.max_consecutive_losses:
+            last_loss_time = self.last_loss_time
+            if last_loss_time:
+                cool_down = rl.cool_down_after_losses
+                time_since_loss = time.monotonic() - last_loss_time
+                if time_since_loss < cool_down:
+                    remaining = int(cool_down - time_since_loss)
                     return False, f"Cool-down period: {remaining}s remaining"
 
         # Check total contracts
-        if self.total_contracts + quantity > self.risk_limits.max_total_contracts:
-            return False, f"Total contracts limit ({self.risk_limits.max_total_contracts}) would be exceeded"
+        max_total = rl.max_total_contracts
+        if self.total_contracts + quantity > max_total:
+            return False, f"Total contracts limit ({max_total}) would be exceeded"
 
         # Check per-trade contracts
-        if quantity > self.risk_limits.max_contracts_per_trade:
-            return False, f"Trade size exceeds max contracts per trade ({self.risk_limits.max_contracts_per_trade})"
+        max_per_trade = rl.max_contracts_per_trade
+        if quantity > max_per_trade:
+            return False, f"Trade size exceeds max contracts per trade ({max_per_trade})"
 
         # Check instrument diversity
-        if instrument not in self.active_positions:
-            if len(self.active_positions) >= self.risk_limits.max_instruments:
-                return False, f"Max instruments limit ({self.risk_limits.max_instruments}) reached"
+        instruments = self._instruments
+        if instrument not in instruments:
+            max_instruments = rl.max_instruments
+            if len(instruments) >= max_instruments:
+                return False, f"Max instruments limit ({max_instruments}) reached"
 
         return True, "Trade allowed"
 
+    def _pnl_block_reason(self) -> Optional[str]:
+        """Return the first P&L limit currently breached, or None"""
+        rl = self.risk_limits
+        daily_cents = self._daily_pnl_cents
+
+        # Check daily loss limit
+        if daily_cents <= -rl._max_daily_loss_cents:
+            return "Daily loss limit reached"
+
+        # Check total loss limit
+        if self._total_pnl_cents <= -rl._max_total_loss_cents:
+            return "Total loss limit reached"
+
+        # Check daily profit target
+        target = rl._daily_profit_target_cents
+        if target is not None and daily_cents >= target:
+            return "Daily profit target reached"
+
+        # Check max daily profit cap
+        profit_cap = rl._max_daily_profit_cents
+        if profit_cap is not None and daily_cents >= profit_cap:
+            return "Max daily profit reached"
+
+        return None
+
+    def _recompute_block_reason(self) -> None:
+        """Refresh the P&L block reason cached for can_trade_fast"""
+        self._block_reason = self._pnl_block_reason()
+
+    def _refresh_trading_hours(self) -> None:
+        """Re-evaluate the trading-hours check and schedule the next one for the minute boundary"""
+        now = datetime.now()
+        self._in_trading_hours = self._is_trading_time()
+        self._hours_recheck_at = time.monotonic() + 60.0 - now.second - now.microsecond / 1e6
+
+    def refresh_limits(self) -> None:
+        """Re-evaluate cached checks after risk_limits has been changed"""
+        self._recompute_block_reason()
+        self._refresh_trading_hours()
+
     def validate_trade_risk(
         self,
         entry_price: float,
@@ -294,45 +745,89 @@ class RiskManager:
             Tuple of (valid, reason)
         """
         # Calculate risk
-        points_at_risk = abs(entry_price - stop_loss)
-        ticks_at_risk = points_at_risk / tick_size
-        risk_per_contract = ticks_at_risk * tick_value
-        total_risk = risk_per_contract * quantity
+        total_risk = _risk_per_contract(entry_price, stop_loss, tick_size, tick_value) * quantity
 
         # Check against max risk per trade
-        if total_risk > self.risk_limits.max_risk_per_trade:
-            return False, f"Trade risk ${total_risk:.2f} exceeds limit ${self.risk_limits.max_risk_per_trade:.2f}"
+        max_risk = self.risk_limits.max_risk_per_trade
+        if total_risk > max_risk:
+            return False, f"Trade risk ${total_risk:.2f} exceeds limit ${max_risk:.2f}"
 
         return True, "Risk acceptable"
 
-    def register_trade(self, instrument: str, quantity: int, is_long: bool):
-        """Register a new trade"""
-        if instrument in self.active_positions:
-            self.active_positions[instrument] += quantity
-        else:
-            self.active_positions[instrument] = quantity
+    def register_trade(
+        self,
+        instrument: str,
+        quantity: int,
+        is_long: bool,
+        tick_size: Optional[float] = None,
+        tick_value: Optional[float] = None
+    ) -> None:
+        """
+        Register a new trade
 
-        self.total_contracts += quantity
+        Quantities net per instrument: a short trade offsets an open long and
+        vice versa. tick_size/tick_value are only needed for mark_to_market;
+        without them prices are taken as dollars per contract.
+        """
+        factor = tick_value / tick_size if tick_size and tick_value is not None else None
+        signed = quantity if is_long else -quantity
+        with self._positions_lock:
+            try:
+                idx = self._instruments.index(instrument)
+            except ValueError:
+                self._instruments.append(sys.intern(instrument))
+                self._quantities.append(signed)
+                self._value_factors.append(1.0 if factor is None else factor)
+            else:
+                net = self._quantities[idx] + signed
+                if net:
+                    self._quantities[idx] = net
+                    if factor is not None:
+                        self._value_factors[idx] = factor
+                else:
+                    del self._instruments[idx]
+                    del self._quantities[idx]
+                    del self._value_factors[idx]
+
+            self.total_contracts += quantity
         self.daily_trades += 1
         self.total_trades += 1
 
-    def close_position(self, instrument: str, quantity: int, pnl: float):
-        """Register position closure"""
-        if instrument in self.active_positions:
-            self.active_positions[instrument] -= quantity
-            if self.active_positions[instrument] <= 0:
-                del self.active_positions[instrument]
-
-        self.total_contracts = max(0, self.total_contracts - quantity)
+    def close_position(self, instrument: str, quantity: int, pnl: float) -> None:
+        """Register position closure (quantity contracts of the open long or short)"""
+        with self._positions_lock:
+            try:
+                idx = self._instruments.index(instrument)
+            except ValueError:
+                pass
+            else:
+                open_qty = self._quantities[idx]
+                # Reduce toward flat; closing the whole position (or more) removes it
+                remaining = open_qty - quantity if open_qty > 0 else open_qty + quantity
+                if remaining * open_qty > 0:
+                    self._quantities[idx] = remaining
+                else:
+                    del self._instruments[idx]
+                    del self._quantities[idx]
+                    del self._value_factors[idx]
+
+            self.total_contracts = max(0, self.total_contracts - quantity)
 
         # Update P&L
-        self.daily_pnl += pnl
-        self.total_pnl += pnl
+        cents = _to_cents(pnl)
+        with self._pnl_lock:
+            self._daily_pnl_cents += cents
+            self._total_pnl_cents += cents
+            head = self._pnl_head
+            self._pnl_ring[head] = pnl
+            self._pnl_head = (head + 1) % _PNL_WINDOW
+            if self._pnl_count < _PNL_WINDOW:
+                self._pnl_count += 1
 
         # Track consecutive losses
         if pnl < 0:
             self.consecutive_losses += 1
-            self.last_loss_time = datetime.now()
+            self.last_loss_time = time.monotonic()
 
             # Check risk level
             if self.consecutive_losses >= self.risk_limits.max_consecutive_losses:
@@ -340,72 +835,96 @@ class RiskManager:
         else:
             self.consecutive_losses = 0
 
-    def update_daily_pnl(self, pnl: float):
+        self._recompute_block_reason()
+
+    def mark_to_market(self, prices: Mapping[str, float]) -> float:
+        """
+        Net dollar value of open positions
+
+        Args:
+            prices: Current price per instrument; every open instrument must be present
+
+        Returns:
+            Sum of signed quantity * price * tick_value / tick_size over open
+            positions (shorts count negative)
+        """
+        with self._positions_lock:
+            instruments = self._instruments
+            try:
+                position_prices = [prices[instrument] for instrument in instruments]
+            except KeyError as exc:
+                raise ValueError(f"No price for open position {exc.args[0]!r}") from None
+            if np is not None and len(instruments) >= _VDOT_MIN_POSITIONS:
+                weights = np.frombuffer(self._quantities, dtype=np.int64) * np.frombuffer(self._value_factors)
+                return float(np.vdot(weights, np.asarray(position_prices, dtype=np.float64)))
+            return math.fsum(
+                q * f * p for q, f, p in zip(self._quantities, self._value_factors, position_prices)
+            )
+
+    def rolling_pnl_array(self) -> Any:
+        """
+        P&Ls of the most recent closed trades as a numpy float64 array
+
+        A zero-copy view of the rolling window (up to 256 trades) in ring
+        order, not chronological order - suited to order-independent stats
+        such as sum, mean and std. Requires numpy.
+        """
+        if np is None:
+            raise RuntimeError("rolling_pnl_array requires numpy (pip install nt8sdk[analytics])")
+        return np.frombuffer(self._pnl_ring, dtype=np.float64, count=self._pnl_count)
+
+    def update_daily_pnl(self, pnl: float) -> None:
         """Update daily P&L"""
         self.daily_pnl = pnl
 
-    def reset_daily_metrics(self):
+    def reset_daily_metrics(self) -> None:
         """Reset daily tracking metrics"""
         self.daily_pnl = 0.0
         self.daily_trades = 0
         self.consecutive_losses = 0
-        self.last_loss_time = None
+        self.last_loss_time = 0.0
 
     def get_risk_level(self) -> RiskLevel:
         """Get current risk level"""
-        # Check daily loss percentage
-        daily_loss_pct = abs(self.daily_pnl / self.risk_limits.max_daily_loss) * 100
-
-        if daily_loss_pct >= 90:
-            return RiskLevel.CRITICAL
-        elif daily_loss_pct >= 70:
-            return RiskLevel.HIGH
-        elif daily_loss_pct >= 50:
-            return RiskLevel.MEDIUM
-        else:
-            return RiskLevel.LOW
+        # Bucket the daily loss percentage
+        daily_loss_pct = abs(self.daily_pnl) * self.risk_limits._inv_max_daily_loss * 100
+        return _RISK_LEVELS[bisect.bisect_right(_RISK_THRESHOLDS, daily_loss_pct)]
 
-    def get_risk_metrics(self) -> dict:
+    def get_risk_metrics(self) -> Dict[str, Any]:
         """Get current risk metrics"""
+        rl = self.risk_limits
+        daily_pnl = self._daily_pnl_cents / 100.0
         return {
             "trading_enabled": self.trading_enabled,
             "risk_level": self.get_risk_level().value,
-            "daily_pnl": self.daily_pnl,
-            "total_pnl": self.total_pnl,
+            "daily_pnl": daily_pnl,
+            "total_pnl": self._total_pnl_cents / 100.0,
             "daily_trades": self.daily_trades,
             "total_trades": self.total_trades,
             "consecutive_losses": self.consecutive_losses,
-            "active_instruments": len(self.active_positions),
+            "active_instruments": len(self._instruments),
+            "max_instruments": rl.max_instruments,
             "total_contracts": self.total_contracts,
-            "daily_loss_used_pct": (abs(self.daily_pnl) / self.risk_limits.max_daily_loss) * 100
-                                   if self.daily_pnl < 0 else 0,
+            "max_total_contracts": rl.max_total_contracts,
+            "daily_loss_used_pct": -daily_pnl * rl._inv_max_daily_loss * 100
+                                   if daily_pnl < 0 else 0,
         }
 
-    def enable_trading(self):
+    def enable_trading(self) -> None:
         """Enable trading"""
         self.trading_enabled = True
         self.shutdown_reason = None
 
-    def disable_trading(self, reason: str):
+    def disable_trading(self, reason: str) -> None:
         """Disable trading"""
         self._trigger_shutdown(reason)
 
     def _is_trading_time(self) -> bool:
         """Check if current time is within trading hours"""
-        if self.risk_limits.trading_start_time is None or self.risk_limits.trading_end_time is None:
-            return True
-
-        current_time = datetime.now().time()
-        start = self.risk_limits.trading_start_time
-        end = self.risk_limits.trading_end_time
+        now = datetime.now()
+        return self.risk_limits._minute_mask[now.hour * 60 + now.minute] == 1
 
-        if start < end:
-            return start <= current_time <= end
-        else:
-            # Handle overnight sessions
-            return current_time >= start or current_time <= end
-
-    def _trigger_shutdown(self, reason: str):
+    def _trigger_shutdown(self, reason: str) -> None:
         """Trigger trading shutdown"""
         self.trading_enabled = False
         self.shutdown_reason = reason
@@ -413,7 +932,7 @@ class RiskManager:
         if self.on_limit_reached:
             self.on_limit_reached(reason)
 
-    def _trigger_risk_alert(self, message: str, level: RiskLevel):
+    def _trigger_risk_alert(self, message: str, level: RiskLevel) -> None:
         """Trigger risk violation alert"""
         if self.on_risk_violation:
             self.on_risk_violation(message, level)
@@ -422,7 +941,7 @@ class RiskManager:
     # SESSION-AWARE RISK MANAGEMENT METHODS
     # =====================================================================
     
-    def set_session_manager(self, session_manager: "SessionManager"):
+    def set_session_manager(self, session_manager: "SessionManager") -> None:
         """
         Set the session manager for session-aware risk checks
         
@@ -448,7 +967,7 @@ class RiskManager:
             return can_trade, reason
         
         # Check session-specific restrictions if session manager is available
-        if hasattr(self, '_session_manager') and self._session_manager is not None:
+        if self._session_manager is not None:
             session_manager = self._session_manager
             
             # Get current session
@@ -485,7 +1004,7 @@ class RiskManager:
         Returns:
             Adjusted position size
         """
-        if not hasattr(self, '_session_manager') or self._session_manager is None:
+        if self._session_manager is None:
             return base_quantity
         
         risk_adjustment = self._session_manager.get_session_risk_adjustment()
@@ -494,11 +1013,11 @@ class RiskManager:
         # Always allow at least 1 contract if base was positive
         return max(1, adjusted) if base_quantity > 0 else 0
     
-    def get_session_risk_metrics(self) -> dict:
+    def get_session_risk_metrics(self) -> Dict[str, Any]:
         """Get risk metrics including session information"""
         base_metrics = self.get_risk_metrics()
         
-        if hasattr(self, '_session_manager') and self._session_manager is not None:
+        if self._session_manager is not None:
             session_manager = self._session_manager
             current_session = session_manager.get_current_session()
             
@@ -520,19 +1039,7 @@ class RiskManager:
 
     def __str__(self) -> str:
         """String representation of risk status"""
-        metrics = self.get_risk_metrics()
-        return f"""
-Risk Manager Status:
-  Trading Enabled: {self.trading_enabled}
-  Risk Level: {metrics['risk_level']}
-  Daily P&L: ${self.daily_pnl:+,.2f}
-  Total P&L: ${self.total_pnl:+,.2f}
-  Daily Trades: {self.daily_trades}
-  Consecutive Losses: {self.consecutive_losses}
-  Active Instruments: {metrics['active_instruments']}/{self.risk_limits.max_instruments}
-  Total Contracts: {self.total_contracts}/{self.risk_limits.max_total_contracts}
-  Daily Loss Used: {metrics['daily_loss_used_pct']:.1f}%
-"""
+        return _STATUS_TEMPLATE.format_map(self.get_risk_metrics())
 
 
 # Helper functions for common risk calculations
@@ -545,7 +1052,7 @@ def calculate_risk_reward_ratio(entry: float, stop: float, target: float) -> flo
 
 
 def calculate_position_value(quantity: int, price: float, tick_size: float, tick_value: float) -> float:
-    """Calculate total position value in dollars"""
+    """Calculate total position value in dollars (element-wise when given numpy arrays)"""
     ticks = price / tick_size
     return quantity * ticks * tick_value
 
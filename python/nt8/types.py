@@ -1,13 +1,39 @@
-from enum import Enum
+"""SDK enums and shared type helpers.
 
+Members are singletons, so hot paths such as order-state dispatch should compare
+with ``is`` (``order.state is OrderState.FILLED``) rather than ``==``.
+"""
 
-class OrderAction(str, Enum):
+import sys
+from enum import Enum, IntEnum
+from typing import Any, Dict, Type, TypeVar, cast
+
+_E = TypeVar("_E", bound="_NamedIntEnum")
+_S = TypeVar("_S", bound="_WireStrEnum")
+
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+class _WireStrEnum(str, Enum):
+    """str Enum with a fast exact-value ``parse`` for the codec layer"""
+
+    @classmethod
+    def parse(cls: Type[_S], text: str) -> _S:
+        """Look up a member by its exact wire value (a dict lookup, no Enum.__call__)"""
+        try:
+            return cast(_S, cls._value2member_map_[text])
+        except KeyError:
+            raise ValueError(f"{text!r} is not a valid {cls.__name__}") from None
+
+
+class OrderAction(_WireStrEnum):
     """Order action: buy or sell"""
     BUY = "BUY"
     SELL = "SELL"
 
 
-class OrderType(str, Enum):
+class OrderType(_WireStrEnum):
     """Order type"""
     MARKET = "MARKET"
     LIMIT = "LIMIT"
@@ -15,36 +41,75 @@ class OrderType(str, Enum):
     STOP_LIMIT = "STOP_LIMIT"
 
 
-class OrderState(str, Enum):
-    """Order state in lifecycle"""
-    INITIALIZED = "INITIALIZED"
-    SUBMITTED = "SUBMITTED"
-    ACCEPTED = "ACCEPTED"
-    WORKING = "WORKING"
-    FILLED = "FILLED"
-    PART_FILLED = "PART_FILLED"
-    CANCELLED = "CANCELLED"
-    REJECTED = "REJECTED"
-    UNKNOWN = "UNKNOWN"
+class _NamedIntEnum(IntEnum):
+    """IntEnum that prints as its member name and can be looked up by name"""
+
+    def __str__(self) -> str:
+        return self.name
 
+    def __format__(self, format_spec: str) -> str:
+        return format(self.name, format_spec)
 
-class MarketDataType(str, Enum):
-    """Market data event types"""
-    ASK = "ASK"
-    BID = "BID"
-    LAST = "LAST"
+    @classmethod
+    def _missing_(cls, value):
+        # Accept member names so OrderState("FILLED") keeps working
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
+    @classmethod
+    def parse(cls: Type[_E], text: str) -> _E:
+        """Look up a member by its exact wire name (a dict lookup, no Enum.__call__)"""
+        try:
+            return cast(_E, cls._member_map_[text])
+        except KeyError:
+            raise ValueError(f"{text!r} is not a valid {cls.__name__}") from None
 
-class MarketPosition(str, Enum):
-    """Position direction"""
-    FLAT = "FLAT"
-    LONG = "LONG"
-    SHORT = "SHORT"
+    @classmethod
+    def from_str(cls: Type[_E], name: str) -> _E:
+        """Look up a member by name (case-insensitive)"""
+        member = cls.__members__.get(name.upper())
+        if member is None:
+            raise ValueError(f"{name!r} is not a valid {cls.__name__}")
+        return member
 
 
-class TimeInForce(str, Enum):
+class OrderState(_NamedIntEnum):
+    """Order state in lifecycle
+
+    SUBMITTED..REJECTED share their values with the binary protocol state byte.
+    The protocol sends 0 for a state it can't map, which decodes as UNKNOWN, not
+    INITIALIZED - map wire states by name (OrderState.parse), not by value.
+    """
+    INITIALIZED = 0
+    SUBMITTED = 1
+    ACCEPTED = 2
+    WORKING = 3
+    FILLED = 4
+    PART_FILLED = 5
+    CANCELLED = 6
+    REJECTED = 7
+    UNKNOWN = 8
+
+
+class MarketDataType(_NamedIntEnum):
+    """Market data event types (values match the ATI MarketData() type codes)"""
+    LAST = 0
+    BID = 1
+    ASK = 2
+
+
+class MarketPosition(_NamedIntEnum):
+    """Position direction (values match the binary protocol position byte)"""
+    FLAT = 0
+    LONG = 1
+    SHORT = 2
+
+
+class TimeInForce(_WireStrEnum):
     """Order time in force"""
     DAY = "DAY"
     GTC = "GTC"
     IOC = "IOC"
-    FOK = "FOK"
\ No newline at end of file
+    FOK = "FOK"
+
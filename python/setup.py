@@ -1,5 +1,16 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Opt-in native build of the risk checks with mypyc (needs mypy in the build environment):
+#   NT8_MYPYC=1 pip install --no-build-isolation .
+# The compiled module is picked up in place of nt8/risk_management.py automatically.
+ext_modules = []
+if os.environ.get("NT8_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["--follow-imports=silent", "nt8/risk_management.py"])
+
 setup(
     name="nt8sdk",
     version="1.1.0",
@@ -11,9 +22,11 @@ setup(
     url="https://github.com/ENHarry/nt8sdk",
     packages=find_packages(exclude=["tests*", "examples*", "backtests*"]),
     package_data={"nt8": ["py.typed"]},
+    ext_modules=ext_modules,
     install_requires=[],
     extras_require={
         "managed": ["pythonnet>=3.0.0"],
+        "analytics": ["numpy>=1.21"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.21.0",